@@ -2,13 +2,15 @@
 
 from .ffprobe import probe_audio
 from .segmenter import plan_and_segment
-from .transcriber import transcribe_manifest
-from .stitcher import stitch_outputs, write_side_outputs
+from .transcriber import transcribe_manifest, transcribe_manifests
+from .stitcher import enabled_outputs, stitch_outputs, write_side_outputs
 
 __all__ = [
     "probe_audio",
     "plan_and_segment", 
     "transcribe_manifest",
+    "transcribe_manifests",
     "stitch_outputs",
     "write_side_outputs",
+    "enabled_outputs",
 ]
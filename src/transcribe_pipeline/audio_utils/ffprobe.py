@@ -1,39 +1,73 @@
-import json
+import functools
+import subprocess
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 from ..dependencies.interfaces import SubprocessProvider
 from ..dependencies.implementations import RealSubprocessProvider
+from ..utils.json_utils import json_loads
+
+
+# Only the fields probe_audio reads; skips tags, disposition and side data
+SHOW_ENTRIES = (
+    "format=duration,bit_rate,format_name,size"
+    ":stream=codec_type,codec_name,duration,bit_rate,sample_rate,channels"
+)
 
 
 def _run(cmd, subprocess_provider: SubprocessProvider):
     """Run FFprobe command using the provided subprocess provider."""
-    import subprocess
     proc = subprocess_provider.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
     if proc.returncode != 0:
         raise RuntimeError(proc.stderr.decode("utf-8", errors="ignore"))
     return proc.stdout
 
 
+# Provider behind probe_audio's cache; injected providers are never cached
+_DEFAULT_PROVIDER = RealSubprocessProvider()
+
+
 def probe_audio(
     path: Path, 
     subprocess_provider: Optional[SubprocessProvider] = None
 ) -> Dict[str, Any]:
-    """Probe audio file metadata using FFprobe with dependency injection."""
-    # Use default provider if not provided (for backward compatibility)
-    if subprocess_provider is None:
-        subprocess_provider = RealSubprocessProvider()
+    """Probe audio file metadata using FFprobe with dependency injection.
+    
+    Probes made with the default provider are cached per file identity
+    (resolved path, mtime, size), so probing an unchanged file again does
+    not spawn another FFprobe. An injected provider always runs FFprobe.
+    """
+    if subprocess_provider is not None:
+        # Uncached: the cache must not keep test/custom providers alive
+        return _probe(str(path), subprocess_provider)
     
+    try:
+        st = Path(path).stat()
+    except OSError:
+        # Let FFprobe report the missing/unreadable file as before
+        return _probe(str(path), _DEFAULT_PROVIDER)
+    
+    meta = _probe_cached(str(Path(path).resolve()), st.st_mtime_ns, st.st_size)
+    return dict(meta)  # callers may modify their copy
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_cached(path_str, mtime_ns, size):
+    # mtime_ns and size are only part of the key: a rewritten file is probed again
+    return _probe(path_str, _DEFAULT_PROVIDER)
+
+
+def _probe(path_str: str, subprocess_provider: SubprocessProvider) -> Dict[str, Any]:
+    """Run FFprobe on one file and normalize the fields the pipeline uses."""
     cmd = [
         "ffprobe",
         "-v", "error",
         "-print_format", "json",
-        "-show_format",
-        "-show_streams",
-        str(path),
+        "-show_entries", SHOW_ENTRIES,
+        path_str,
     ]
     out = _run(cmd, subprocess_provider)
-    data = json.loads(out.decode("utf-8"))
+    data = json_loads(out)
 
     fmt = data.get("format", {})
     streams = data.get("streams", [])
@@ -50,5 +84,6 @@ def probe_audio(
         "sample_rate": sample_rate,
         "channels": channels,
         "format_name": fmt.get("format_name"),
+        "codec_name": astream.get("codec_name"),  # decides whether chunks can be stream-copied
         "size_bytes": int(fmt.get("size", 0)),
     }
\ No newline at end of file
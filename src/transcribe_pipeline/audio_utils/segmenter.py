@@ -1,34 +1,82 @@
-import json
+import concurrent.futures
+import csv
+import functools
 import math
+import os
+import subprocess
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from ..utils.json_utils import json_dumps
 from ..dependencies.interfaces import SubprocessProvider, FileSystemProvider
 from ..dependencies.implementations import RealSubprocessProvider, RealFileSystemProvider
 
 
+# ffmpeg prefix: never read stdin, and only log errors (no banner/progress)
+FFMPEG_CMD = ["ffmpeg", "-y", "-nostdin", "-hide_banner", "-loglevel", "error", "-nostats"]
+
+
 def _run(cmd, subprocess_provider: SubprocessProvider):
     """Run FFmpeg command using the provided subprocess provider."""
-    import subprocess
-    proc = subprocess_provider.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+    # ffmpeg writes nothing useful to stdout; stderr is kept for error text
+    proc = subprocess_provider.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False)
     if proc.returncode != 0:
         raise RuntimeError(proc.stderr.decode("utf-8", errors="ignore"))
     return proc
 
 
 def _safe_chunk_window(meta, config):
+    return _chunk_window_secs(
+        int(meta["bit_rate"]),
+        config.chunking.target_chunk_mb,
+        config.chunking.max_chunk_secs,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _chunk_window_secs(bit_rate, target_chunk_mb, max_chunk_secs):
     # Compute chunk seconds from target MB & bitrate; guard with max_chunk_secs
     # MB ≈ (kbps * secs) / (8*1000)  => secs ≈ MB * 8000 / kbps
-    bitrate_kbps = max(1, int(meta["bit_rate"]) // 1000)
-    t_by_mb = config.chunking.target_chunk_mb * 8000 / bitrate_kbps
-    t_max = config.chunking.max_chunk_secs
-    chunk_secs = max(60, min(t_by_mb, t_max))  # at least 60s
+    # Cached: batch runs over many files usually share bitrate and config
+    bitrate_kbps = max(1, bit_rate // 1000)
+    t_by_mb = target_chunk_mb * 8000 / bitrate_kbps
+    chunk_secs = max(60, min(t_by_mb, max_chunk_secs))  # at least 60s
     return float(chunk_secs)
 
 
-def _encode_args(config):
+# Chunk extensions for stream-copied audio, keyed by ffprobe's format_name
+# (first entry, e.g. "mov" for "mov,mp4,m4a,3gp,3g2,mj2")
+_COPY_EXTENSIONS = {
+    "mp3": ".mp3",
+    "mov": ".m4a",
+    "wav": ".wav",
+    "flac": ".flac",
+    "ogg": ".ogg",
+}
+
+
+# Audio codecs the ipod (.m4a) muxer accepts; MP4/MOV sources carrying
+# PCM, Opus, MP3, ... are re-encoded instead
+_M4A_COPY_CODECS = ("aac", "alac")
+
+
+def _copy_extension(meta):
+    """Chunk extension for stream-copying this source, or None if it must be re-encoded."""
+    container = (meta.get("format_name") or "").split(",")[0]
+    ext = _COPY_EXTENSIONS.get(container)
+    if ext == ".m4a" and meta.get("codec_name") not in _M4A_COPY_CODECS:
+        return None
+    return ext
+
+
+def _encode_args(config, meta):
     if not config.reencode.enabled:
-        return []
+        if _copy_extension(meta) is None:
+            # Unmapped container (matroska, asf, aiff, ...) or an MP4 codec
+            # .m4a can't hold: let ffmpeg pick the container's default (AAC)
+            return []
+        # Stream copy: no decode/encode; drop cover-art/video streams
+        return ["-vn", "-c:a", "copy"]
     return [
         "-ac", str(config.reencode.channels),
         "-ar", str(config.reencode.sample_rate),
@@ -37,22 +85,106 @@ def _encode_args(config):
     ]
 
 
-def _out_ext(config):
+def _out_ext(config, meta):
     if not config.reencode.enabled:
-        return ".m4a"  # container copy fallback
+        # Keep the source container so copied streams stay muxable
+        return _copy_extension(meta) or ".m4a"
     codec = config.reencode.codec.lower()
     return ".m4a" if codec in ("aac", "libfdk_aac") else ".wav"
 
 
 def _format_time(seconds: float) -> str:
     # HH:MM:SS.mmm
-    ms = int((seconds - int(seconds)) * 1000)
-    s = int(seconds) % 60
-    m = (int(seconds) // 60) % 60
-    h = int(seconds) // 3600
+    s, ms = divmod(int(seconds * 1000), 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
     return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
 
 
+def _new_chunk(idx, out_path, start, end, overlap_head, overlap_tail):
+    return {
+        "index": idx,
+        "file": str(out_path),
+        "t_start": start,
+        "t_end": end,
+        "overlap_head": overlap_head,
+        "overlap_tail": overlap_tail,
+        "status": "pending",
+        "text": None,
+        "latency_ms": None,
+        "retries": 0,
+    }
+
+
+def _segment_overlapping(input_path, duration, window, overlap, encode_args, ext,
+                         chunks_dir, subprocess_provider):
+    """Cut overlapping chunks with one ffmpeg process per chunk."""
+    # Simple fixed windows (optional: add silence-aware refinement later)
+    # Window starts are computed as i * window rather than by repeated
+    # addition, so boundaries do not accumulate float drift on long inputs.
+    cut_points = []
+    for i in range(math.ceil(duration / window)):
+        t = i * window
+        start = max(0.0, t - (overlap if t > 0 else 0.0))
+        end = min(duration, t + window + (overlap if t + window < duration else 0.0))
+        cut_points.append((start, end))
+
+    chunks = []
+    cmds = []
+    for idx, (start, end) in enumerate(cut_points):
+        out_name = f"chunk_{idx:04d}{ext}"
+        out_path = chunks_dir / out_name
+        length = max(0.01, end - start)
+        cmds.append(FFMPEG_CMD + [
+            "-ss", f"{start:.3f}",
+            "-i", str(input_path),
+            "-t", f"{length:.3f}",
+        ] + encode_args + [str(out_path)])
+
+        chunks.append(_new_chunk(
+            idx, out_path, start, end,
+            overlap_head=overlap if idx > 0 else 0.0,
+            overlap_tail=overlap if end < duration else 0.0,
+        ))
+
+    # Segments are independent ffmpeg processes, so cut them concurrently
+    # (one per core); chunk order comes from the plan, not completion order.
+    max_workers = max(1, min(os.cpu_count() or 1, len(cmds)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
+        list(ex.map(lambda cmd: _run(cmd, subprocess_provider), cmds))
+
+    return chunks
+
+
+def _segment_single_pass(input_path, window, encode_args, ext,
+                         chunks_dir, subprocess_provider, fs_provider):
+    """Cut non-overlapping chunks in a single pass with ffmpeg's segment muxer."""
+    # The input is demuxed/decoded once; the muxer records the actual
+    # boundaries (which may snap to packet edges) in a CSV segment list.
+    segment_list = chunks_dir / "segments.csv"
+    cmd = FFMPEG_CMD + [
+        "-i", str(input_path),
+    ] + encode_args + [
+        "-f", "segment",
+        "-segment_time", f"{window:.3f}",
+        "-segment_start_number", "0",
+        "-reset_timestamps", "1",
+        "-segment_list", str(segment_list),
+        "-segment_list_type", "csv",
+        str(chunks_dir / f"chunk_%04d{ext}"),
+    ]
+    _run(cmd, subprocess_provider)
+
+    rows = csv.reader(fs_provider.read_text(segment_list, encoding="utf-8").splitlines())
+    chunks = []
+    for idx, (name, start, end) in enumerate(row for row in rows if row):
+        chunks.append(_new_chunk(
+            idx, chunks_dir / name, float(start), float(end),
+            overlap_head=0.0, overlap_tail=0.0,
+        ))
+    return chunks
+
+
 def plan_and_segment(
     input_path: Path, 
     meta: Dict[str, Any], 
@@ -76,43 +208,19 @@ def plan_and_segment(
     overlap = float(config.chunking.overlap_secs)
     window = _safe_chunk_window(meta, config)
 
-    # Simple fixed windows (optional: add silence-aware refinement later)
-    cut_points = []
-    t = 0.0
-    while t < duration:
-        start = max(0.0, t - (overlap if t > 0 else 0.0))
-        end = min(duration, t + window + (overlap if t + window < duration else 0.0))
-        cut_points.append((start, end))
-        t += window
-
-    encode_args = _encode_args(config)
-    ext = _out_ext(config)
+    encode_args = _encode_args(config, meta)
+    ext = _out_ext(config, meta)
 
-    chunks = []
-    for idx, (start, end) in enumerate(cut_points):
-        out_name = f"chunk_{idx:04d}{ext}"
-        out_path = chunks_dir / out_name
-        length = max(0.01, end - start)
-        cmd = [
-            "ffmpeg", "-y",
-            "-ss", f"{start:.3f}",
-            "-i", str(input_path),
-            "-t", f"{length:.3f}",
-        ] + encode_args + [str(out_path)]
-        _run(cmd, subprocess_provider)
-
-        chunks.append({
-            "index": idx,
-            "file": str(out_path),
-            "t_start": start,
-            "t_end": end,
-            "overlap_head": overlap if idx > 0 else 0.0,
-            "overlap_tail": overlap if end < duration else 0.0,
-            "status": "pending",
-            "text": None,
-            "latency_ms": None,
-            "retries": 0,
-        })
+    if overlap > 0:
+        chunks = _segment_overlapping(
+            input_path, duration, window, overlap, encode_args, ext,
+            chunks_dir, subprocess_provider,
+        )
+    else:
+        chunks = _segment_single_pass(
+            input_path, window, encode_args, ext,
+            chunks_dir, subprocess_provider, fs_provider,
+        )
 
     manifest = {
         "input": str(input_path),
@@ -125,5 +233,4 @@ def plan_and_segment(
     }
 
     # Write manifest using file system provider
-    manifest_content = json.dumps(manifest, indent=2)
-    fs_provider.write_text(manifest_path, manifest_content, encoding="utf-8")
\ No newline at end of file
+    fs_provider.write_bytes(manifest_path, json_dumps(manifest))
\ No newline at end of file
@@ -1,80 +1,87 @@
-import json
+import concurrent.futures
 import math
-from datetime import timedelta
 from pathlib import Path
+from typing import Optional
 from difflib import SequenceMatcher
 
+from ..utils.json_utils import json_dumps, json_loads
+
 
 def _normalize_text(s: str) -> str:
     if not s:
         return ""
-    # Basic normalization to stabilize matching
+    # Basic normalization to stabilize matching. Chained str.replace beats
+    # a regex sub or str.translate for single characters; joining a list
+    # avoids the generator overhead inside str.join.
     s = s.replace("\r", "\n").replace("\u200b", "")
-    s = "\n".join(line.strip() for line in s.splitlines())
+    s = "\n".join([line.strip() for line in s.splitlines()])
     return s
 
 
-def _dedup_join(prev: str, nxt: str, window: int = 500, min_match: int = 30) -> str:
-    prev_n = _normalize_text(prev)
-    nxt_n = _normalize_text(nxt)
+# Overlap detection between consecutive chunks
+DEDUP_WINDOW = 500  # characters compared on each side of a chunk boundary
+DEDUP_MIN_MATCH = 30  # shortest common run treated as duplicated overlap
 
-    tail = prev_n[-window:]
-    head = nxt_n[:window]
 
+def _overlap_end(tail: str, head: str, min_match: int = DEDUP_MIN_MATCH) -> int:
+    """Return the index in ``head`` just past the text it shares with ``tail``, or -1."""
     sm = SequenceMatcher(None, tail, head, autojunk=False)
-    match = max(sm.get_opcodes(), key=lambda op: (op[0] == "equal", op[3]-op[2]))
-    # op: (tag, i1, i2, j1, j2)
-    tag, i1, i2, j1, j2 = match
-    if tag == "equal" and (i2 - i1) >= min_match:
-        # Drop the overlapping text from the next chunk
-        deduped = prev_n + head[j2:]
-    else:
-        deduped = prev_n + " " + nxt_n
-    return deduped.strip()
+    _, j, size = sm.find_longest_match(0, len(tail), 0, len(head))
+    if size >= min_match:
+        return j + size
+    return -1
 
 
 def _fmt_ts(seconds: float) -> str:
-    td = timedelta(seconds=float(seconds))
     # SRT format: HH:MM:SS,mmm
-    total_seconds = int(td.total_seconds())
-    ms = int((float(seconds) - int(float(seconds))) * 1000)
-    h = total_seconds // 3600
-    m = (total_seconds % 3600) // 60
-    s = total_seconds % 60
+    s, ms = divmod(int(seconds * 1000), 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
     return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
 
 
-def stitch_outputs(manifest_path: Path):
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+def stitch_outputs(manifest_path: Path, manifest: Optional[dict] = None):
+    # Callers that already hold the parsed manifest pass it to skip a re-read
+    if manifest is None:
+        manifest = json_loads(manifest_path.read_bytes())
     chunks = manifest["chunks"]
 
-    merged_text = ""
+    # Build the transcript as a list of pieces and only keep the last
+    # DEDUP_WINDOW characters for matching, so each merge costs O(window)
+    # instead of copying and re-normalizing the whole accumulated text.
+    pieces = []
+    tail = ""
     merged_chunks = []
 
-    for i, c in enumerate(chunks):
+    for c in chunks:
         text = c.get("text") or ""
         if not text:
             continue
-        if i == 0:
-            merged_text = _normalize_text(text)
+        text = _normalize_text(text)
+        if not pieces:
+            piece = text
         else:
-            merged_text = _dedup_join(merged_text, text)
+            cut = _overlap_end(tail, text[:DEDUP_WINDOW])
+            # Drop the overlapping text from the next chunk
+            piece = text[cut:] if cut >= 0 else " " + text
+        piece = piece.rstrip()
+        pieces.append(piece)
+        tail = (tail + piece)[-DEDUP_WINDOW:]
         merged_chunks.append({
             "index": c["index"],
             "t_start": c["t_start"],
             "t_end": c["t_end"],
-            "text": _normalize_text(text),
+            "text": text,
         })
 
-    return merged_text.strip(), merged_chunks
+    return "".join(pieces).strip(), merged_chunks
 
 
-def _write_txt(out_dir: Path, full_text: str):
-    (out_dir / "transcript.txt").write_text(full_text, encoding="utf-8")
+def _render_txt(full_text: str, merged_chunks: list, manifest: dict) -> bytes:
+    return full_text.encode("utf-8")
 
 
-def _write_json(out_dir: Path, full_text: str, merged_chunks: list, manifest_path: Path):
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+def _render_json(full_text: str, merged_chunks: list, manifest: dict) -> bytes:
     data = {
         "source": manifest.get("input"),
         "meta": manifest.get("meta"),
@@ -84,9 +91,7 @@ def _write_json(out_dir: Path, full_text: str, merged_chunks: list, manifest_pat
         "chunks": merged_chunks,
         "full_text": full_text,
     }
-    (out_dir / "transcript.json").write_text(
-        json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    return json_dumps(data)
 
 
 def _split_text_by_chars(text: str, parts: int) -> list:
@@ -100,42 +105,64 @@ def _split_text_by_chars(text: str, parts: int) -> list:
     return res
 
 
-def _write_srt(out_dir: Path, merged_chunks: list):
+def _srt_spans(merged_chunks: list):
     # Coarse: split each chunk into ~10s spans by relative length
-    lines = []
-    idx = 1
     for ch in merged_chunks:
         t0, t1 = float(ch["t_start"]), float(ch["t_end"])
         dur = max(0.001, t1 - t0)
-        text = ch["text"]
         # target 10s spans
         nspans = max(1, int(round(dur / 10.0)))
-        parts = _split_text_by_chars(text, nspans)
-        # map each part evenly across the interval
+        parts = _split_text_by_chars(ch["text"], nspans)
+        n = len(parts)
+        # map each part evenly across the interval; adjacent spans share a
+        # boundary, so each one is formatted only once
+        bounds = [_fmt_ts(t0 + (dur * j) / n) for j in range(n + 1)]
         for j, part in enumerate(parts):
-            s = t0 + (dur * j) / len(parts)
-            e = t0 + (dur * (j + 1)) / len(parts)
-            lines.append(f"{idx}\n{_fmt_ts(s)} --> {_fmt_ts(e)}\n{part.strip()}\n")
-            idx += 1
+            yield bounds[j], bounds[j + 1], part.strip()
+
 
-    (out_dir / "transcript.srt").write_text("\n".join(lines), encoding="utf-8")
+def _render_srt(full_text: str, merged_chunks: list, manifest: dict) -> bytes:
+    return "\n".join(
+        f"{idx}\n{s} --> {e}\n{text}\n"
+        for idx, (s, e, text) in enumerate(_srt_spans(merged_chunks), start=1)
+    ).encode("utf-8")
 
 
-def _write_vtt(out_dir: Path, merged_chunks: list):
+def _render_vtt(full_text: str, merged_chunks: list, manifest: dict) -> bytes:
     lines = ["WEBVTT", ""]
     for ch in merged_chunks:
         s = _fmt_ts(ch["t_start"]).replace(",", ".")
         e = _fmt_ts(ch["t_end"]).replace(",", ".")
         lines.append(f"{s} --> {e}\n{ch['text'].strip()}\n")
-    (out_dir / "transcript.vtt").write_text("\n".join(lines), encoding="utf-8")
-
-
-def write_side_outputs(out_dir: Path, full_text: str, merged_chunks: list, manifest_path: Path, config):
-    if config.outputs.write_txt:
-        _write_txt(out_dir, full_text)
-    if config.outputs.write_json:
-        _write_json(out_dir, full_text, merged_chunks, manifest_path)
-    if config.outputs.write_srt:
-        _write_srt(out_dir, merged_chunks)
-    if config.outputs.write_vtt:
-        _write_vtt(out_dir, merged_chunks)
\ No newline at end of file
+    return "\n".join(lines).encode("utf-8")
+
+
+# Side outputs: (file name, OutputConfig flag, renderer); renderers share
+# one signature so writing and reporting are driven by this table alone.
+OUTPUT_SPECS = (
+    ("transcript.txt", "write_txt", _render_txt),
+    ("transcript.json", "write_json", _render_json),
+    ("transcript.srt", "write_srt", _render_srt),
+    ("transcript.vtt", "write_vtt", _render_vtt),
+)
+
+
+def enabled_outputs(config) -> list:
+    """Names of the side-output files enabled in the configuration."""
+    return [name for name, flag, _ in OUTPUT_SPECS if getattr(config.outputs, flag)]
+
+
+def write_side_outputs(out_dir: Path, full_text: str, merged_chunks: list, manifest_path: Path, config,
+                       manifest: Optional[dict] = None):
+    if manifest is None:
+        manifest = json_loads(manifest_path.read_bytes())
+    # Render every enabled output in memory first, then write each file with
+    # a single write; the files are independent, so their I/O overlaps.
+    outputs = [
+        (name, render(full_text, merged_chunks, manifest))
+        for name, flag, render in OUTPUT_SPECS
+        if getattr(config.outputs, flag)
+    ]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(outputs))) as ex:
+        list(ex.map(lambda out: (out_dir / out[0]).write_bytes(out[1]), outputs))
@@ -1,8 +1,8 @@
-import concurrent.futures
-import json
-import time
+import asyncio
+import itertools
+import random
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from tqdm import tqdm
 
@@ -12,6 +12,7 @@ from ..dependencies.interfaces import (
     TimeProvider,
     EnvironmentProvider,
 )
+from ..utils.json_utils import json_dumps, json_loads
 from ..dependencies.implementations import (
     RealOpenAIClientProvider,
     RealFileSystemProvider,
@@ -22,33 +23,93 @@ from ..dependencies.implementations import (
 
 TRANSIENT_ERRORS = ("rate_limit_exceeded", "server_error", "temporarily_unavailable")
 
+# Minimum interval between full manifest rewrites while chunks are completing
+MANIFEST_SAVE_INTERVAL_SECS = 2.0
+
+# Longest server-requested retry delay honored; a bogus or hostile
+# Retry-After must not park a worker for hours
+RETRY_AFTER_MAX_SECS = 60.0
+
 
 def _save_manifest(manifest_path: Path, manifest: dict, fs_provider: FileSystemProvider):
     """Save manifest to file using the provided file system provider."""
-    content = json.dumps(manifest, indent=2, ensure_ascii=False)
-    fs_provider.write_text(manifest_path, content, encoding="utf-8")
+    fs_provider.write_bytes(manifest_path, json_dumps(manifest))
+
+
+def _results_path(manifest_path: Path) -> Path:
+    """Path of the append-only JSONL sidecar that logs chunk results."""
+    return manifest_path.with_suffix(".jsonl")
+
+
+def _append_result(results_path: Path, chunk: dict, fs_provider: FileSystemProvider):
+    """Append a single chunk's outcome to the JSONL sidecar."""
+    record = {
+        "index": chunk["index"],
+        "status": chunk["status"],
+        "text": chunk.get("text"),
+        "latency_ms": chunk.get("latency_ms"),
+        "error": chunk.get("error"),
+    }
+    fs_provider.append_bytes(results_path, json_dumps(record, indent=False) + b"\n")
+
+
+def _clear_results(results_path: Path, fs_provider: FileSystemProvider):
+    """Empty the sidecar once its results are all in a saved manifest."""
+    # Truncate rather than delete: FileSystemProvider has no unlink, and an
+    # empty sidecar replays as a no-op
+    if fs_provider.exists(results_path):
+        fs_provider.write_bytes(results_path, b"")
+
+
+def _replay_results(results_path: Path, manifest: dict, fs_provider: FileSystemProvider):
+    """Apply sidecar outcomes to chunks the manifest still lists as pending.
+    
+    Recovers results logged after the last full manifest save (e.g. when a
+    run was interrupted), so those chunks are not sent to the API again.
+    """
+    if not fs_provider.exists(results_path):
+        return
+    data = fs_provider.read_binary(results_path)
+    if data and not data.endswith(b"\n"):
+        # Terminate a torn final line so the next append starts a fresh record
+        fs_provider.append_bytes(results_path, b"\n")
+    chunks = {c["index"]: c for c in manifest["chunks"]}
+    for line in data.splitlines():
+        try:
+            record = json_loads(line)
+        except ValueError:
+            continue  # torn final line from an interrupted append
+        chunk = chunks.get(record.get("index"))
+        if chunk is None or chunk.get("status") != "pending":
+            continue
+        chunk["status"] = record["status"]
+        for key in ("text", "latency_ms", "error"):
+            if record.get(key) is not None:
+                chunk[key] = record[key]
 
 
-def _transcribe_one(
+def _request_options(config: Any) -> tuple[str, str, Optional[str]]:
+    """Resolve the per-request API options (model, response_format, prompt) once."""
+    return config.model.model, config.model.response_format, config.model.prompt or None
+
+
+async def _transcribe_one(
     client: Any, 
     chunk: dict, 
-    config: Any,
+    options: tuple[str, str, Optional[str]],
     openai_provider: OpenAIClientProvider,
     time_provider: TimeProvider
 ) -> tuple[str, int]:
     """Transcribe a single audio chunk using the provided providers."""
     start = time_provider.time()
-    model = config.model.model
-    response_format = config.model.response_format
-    prompt = config.model.prompt
+    model, response_format, prompt = options
 
-    audio_file = Path(chunk["file"])
-    data = openai_provider.transcribe_audio(
+    data = await openai_provider.transcribe_audio(
         client=client,
-        audio_file=audio_file,
+        audio_file=Path(chunk["file"]),
         model=model,
         response_format=response_format,
-        prompt=prompt if prompt else None,
+        prompt=prompt,
     )
 
     text = data.get("text") if isinstance(data, dict) else None
@@ -56,25 +117,55 @@ def _transcribe_one(
     return text, latency_ms
 
 
-def _retrying_transcribe(
+def _is_transient(exc: Exception) -> bool:
+    """Whether an API error is worth retrying (rate limits, server hiccups)."""
+    # Plain substring checks on the lowered message beat a compiled
+    # alternation regex here, with or without re.IGNORECASE
+    msg = str(exc).lower()
+    return any(t in msg for t in TRANSIENT_ERRORS)
+
+
+def _retry_after_secs(exc: Exception) -> Optional[float]:
+    """Return the server-requested retry delay from an API error, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    for name, scale in (("retry-after-ms", 1000.0), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return min(RETRY_AFTER_MAX_SECS, max(0.0, float(value) / scale))
+        except (TypeError, ValueError):
+            continue  # e.g. an HTTP-date; fall back to backoff
+    return None
+
+
+async def _retrying_transcribe(
     client: Any,
     chunk: dict,
     config: Any,
     openai_provider: OpenAIClientProvider,
-    time_provider: TimeProvider
+    time_provider: TimeProvider,
+    options: Optional[tuple[str, str, Optional[str]]] = None
 ) -> tuple[str, int]:
     """Transcribe with retry logic using the provided providers."""
     max_retries = config.model.max_retries
-    backoff = config.model.backoff_base_ms
+    schedule = config.model.backoff_schedule  # built once per chunk, not per retry
+    if options is None:
+        options = _request_options(config)
 
     for attempt in range(max_retries + 1):
         try:
-            return _transcribe_one(client, chunk, config, openai_provider, time_provider)
+            return await _transcribe_one(client, chunk, options, openai_provider, time_provider)
         except Exception as e:
-            msg = str(e).lower()
-            if attempt < max_retries and any(t in msg for t in TRANSIENT_ERRORS):
-                delay = (2 ** attempt) * backoff / 1000.0
-                time_provider.sleep(delay)
+            if attempt < max_retries and _is_transient(e):
+                # Honor Retry-After; otherwise use full jitter so parallel
+                # workers that hit the same rate limit don't retry in lock-step.
+                delay = _retry_after_secs(e)
+                if delay is None:
+                    delay = random.uniform(0.0, schedule[attempt])
+                await time_provider.sleep_async(delay)
                 continue
             raise
 
@@ -88,6 +179,34 @@ def transcribe_manifest(
     env_provider: Optional[EnvironmentProvider] = None
 ):
     """Transcribe all pending chunks in the manifest using dependency injection."""
+    transcribe_manifests(
+        [manifest_path], config, openai_provider, fs_provider, time_provider, env_provider
+    )
+
+
+def transcribe_manifests(
+    manifest_paths: List[Path], 
+    config: Any,
+    openai_provider: Optional[OpenAIClientProvider] = None,
+    fs_provider: Optional[FileSystemProvider] = None,
+    time_provider: Optional[TimeProvider] = None,
+    env_provider: Optional[EnvironmentProvider] = None
+):
+    """Transcribe the pending chunks of several manifests with one shared client."""
+    asyncio.run(_transcribe_manifests_async(
+        manifest_paths, config, openai_provider, fs_provider, time_provider, env_provider
+    ))
+
+
+async def _transcribe_manifests_async(
+    manifest_paths: List[Path], 
+    config: Any,
+    openai_provider: Optional[OpenAIClientProvider] = None,
+    fs_provider: Optional[FileSystemProvider] = None,
+    time_provider: Optional[TimeProvider] = None,
+    env_provider: Optional[EnvironmentProvider] = None
+):
+    """Transcribe pending chunks concurrently on a single event loop."""
     # Use default providers if not provided (for backward compatibility)
     if openai_provider is None:
         openai_provider = RealOpenAIClientProvider()
@@ -101,20 +220,32 @@ def transcribe_manifest(
     # Get API key using environment provider
     api_key = env_provider.get_required("OPENAI_API_KEY")
     
-    # Create OpenAI client using provider
-    client = openai_provider.create_client(api_key)
-    
-    # Read manifest using file system provider
-    manifest_content = fs_provider.read_text(manifest_path, encoding="utf-8")
-    manifest = json.loads(manifest_content)
+    # Read manifests using file system provider; chunks from every manifest
+    # share one work queue, so a batch of files keeps all workers busy.
+    manifests = {path: json_loads(fs_provider.read_binary(path)) for path in manifest_paths}
+    results_paths = {path: _results_path(path) for path in manifests}
+    for path, manifest in manifests.items():
+        _replay_results(results_paths[path], manifest, fs_provider)
 
-    pending = [c for c in manifest["chunks"] if c.get("status") == "pending"]
-    pbar = tqdm(total=len(pending), desc="Transcribing", unit="chunk")
+    pending = [
+        (path, c)
+        for path, manifest in manifests.items()
+        for c in manifest["chunks"]
+        if c.get("status") == "pending"
+    ]
+
+    # Each completion is appended to its manifest's sidecar (O(1) per chunk);
+    # full manifests are only rewritten every MANIFEST_SAVE_INTERVAL_SECS and at the end.
+    unsaved = set()
+    last_save = time_provider.monotonic()
+
+    # Config is resolved once; workers only pass the primitive values along
+    options = _request_options(config)
 
-    def work(c):
+    async def work(path, c):
         try:
-            text, latency = _retrying_transcribe(
-                client, c, config, openai_provider, time_provider
+            text, latency = await _retrying_transcribe(
+                client, c, config, openai_provider, time_provider, options
             )
             c["text"] = text
             c["latency_ms"] = latency
@@ -122,16 +253,47 @@ def transcribe_manifest(
         except Exception as e:
             c["status"] = "error"
             c["error"] = str(e)
-        finally:
-            return c
-
-    max_workers = config.model.parallel_requests
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [ex.submit(work, c) for c in pending]
-        for fut in concurrent.futures.as_completed(futures):
-            _ = fut.result()
-            pbar.update(1)
-            _save_manifest(manifest_path, manifest, fs_provider)
-
-    pbar.close()
-    _save_manifest(manifest_path, manifest, fs_provider)
\ No newline at end of file
+        _append_result(results_paths[path], c, fs_provider)
+        return path
+
+    # At most parallel_requests tasks exist at once, all sharing one client.
+    # Completions are handled per wake-up, so the progress bar and manifest
+    # bookkeeping run once per batch rather than once per chunk.
+    limit = config.model.parallel_requests
+    queue = iter(pending)
+    in_flight = set()
+
+    # Create one OpenAI client (and connection pool) for the whole run, only
+    # once manifests are loaded, so a bad manifest leaves no pool to close
+    client = openai_provider.create_client(
+        api_key, max_connections=config.model.parallel_requests
+    )
+    pbar = tqdm(total=len(pending), desc="Transcribing", unit="chunk")
+    try:
+        while True:
+            for path, c in itertools.islice(queue, limit - len(in_flight)):
+                in_flight.add(asyncio.create_task(work(path, c)))
+            if not in_flight:
+                break
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                unsaved.add(task.result())  # also surfaces unexpected (e.g. file system) errors
+            pbar.update(len(done))
+            now = time_provider.monotonic()
+            if now - last_save >= MANIFEST_SAVE_INTERVAL_SECS:
+                for path in unsaved:
+                    _save_manifest(path, manifests[path], fs_provider)
+                unsaved.clear()
+                last_save = now
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+        await openai_provider.close_client(client)
+        pbar.close()
+
+    for path, manifest in manifests.items():
+        _save_manifest(path, manifest, fs_provider)
+        # Every logged result is now in the manifest; don't let the sidecar
+        # grow across runs or be replayed again
+        _clear_results(results_paths[path], fs_provider)
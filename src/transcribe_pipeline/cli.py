@@ -6,15 +6,12 @@ optional configuration overrides.
 """
 
 import argparse
+import os
 import sys
 import time
 from pathlib import Path
 
 from .config.pipeline_config import create_default_config
-from .audio_utils.ffprobe import probe_audio
-from .audio_utils.segmenter import plan_and_segment
-from .audio_utils.transcriber import transcribe_manifest
-from .audio_utils.stitcher import stitch_outputs, write_side_outputs
 
 
 def main():
@@ -28,13 +25,16 @@ Examples:
   transcribe-pipeline audio.mp3 --model gpt-4o-mini-transcribe
   transcribe-pipeline audio.mp3 --segmenter silence --prompt "Technical presentation"
   transcribe-pipeline audio.mp3 --work-dir ./transcripts
+  transcribe-pipeline lecture1.mp3 lecture2.mp3 lecture3.mp3
         """
     )
     
-    # Required positional argument for input audio file
+    # Required positional argument for input audio file(s)
     parser.add_argument(
-        "audio_file",
-        help="Path to input audio file"
+        "audio_files",
+        nargs="+",
+        metavar="audio_file",
+        help="Path to input audio file (several files are transcribed in one batch)"
     )
     
     # Optional configuration overrides
@@ -64,58 +64,72 @@ Examples:
     args = parser.parse_args()
 
     try:
+        # Imported here so --help and usage errors don't pay for loading
+        # the OpenAI SDK (httpx, pydantic) behind the audio modules
+        from .audio_utils.ffprobe import probe_audio
+        from .audio_utils.segmenter import plan_and_segment
+        from .audio_utils.transcriber import transcribe_manifests
+        from .audio_utils.stitcher import enabled_outputs, stitch_outputs, write_side_outputs
+        from .utils.json_utils import json_loads
+        
         # Create configuration instance
         config = create_default_config()
         
         # Apply CLI overrides
         config.apply_cli_overrides(args)
         
-        # Get input audio path
-        input_path = config.get_input_audio_path(args.audio_file)
+        # Get input audio paths (all are checked before any work starts)
+        input_paths = [config.get_input_audio_path(f) for f in args.audio_files]
         
-        # Prepare work directory
+        # Prepare work directory; a batch gets one sub-directory per file
         root_out = config.get_work_directory(args.work_dir)
-        job_id = time.strftime("%Y%m%d-%H%M%S")
-        out_dir = root_out / job_id
-        chunks_dir = out_dir / "chunks"
-        chunks_dir.mkdir(parents=True, exist_ok=True)
+        # The timestamp keeps run directories sorted; the PID keeps runs
+        # started within the same second from sharing (and overwriting) one
+        job_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        job_dir = root_out / job_id
 
         # Log configuration for debugging
         config.log_configuration()
 
-        # Probe audio and save effective configuration
-        meta = probe_audio(input_path)
-        config.save_effective_config(out_dir)
+        # Probe and segment every file first
+        jobs = []  # (out_dir, manifest_path)
+        for i, input_path in enumerate(input_paths, start=1):
+            out_dir = job_dir if len(input_paths) == 1 else job_dir / f"{i:03d}_{input_path.stem}"
+            chunks_dir = out_dir / "chunks"
+            chunks_dir.mkdir(parents=True, exist_ok=True)
 
-        # Run the pipeline
-        manifest_path = out_dir / "manifest.json"
-        plan_and_segment(
-            input_path=input_path,
-            meta=meta,
-            config=config,
-            chunks_dir=chunks_dir,
-            manifest_path=manifest_path,
-        )
+            # Probe audio and save effective configuration
+            meta = probe_audio(input_path)
+            config.save_effective_config(out_dir)
+
+            manifest_path = out_dir / "manifest.json"
+            plan_and_segment(
+                input_path=input_path,
+                meta=meta,
+                config=config,
+                chunks_dir=chunks_dir,
+                manifest_path=manifest_path,
+            )
+            jobs.append((out_dir, manifest_path))
 
-        transcribe_manifest(
-            manifest_path=manifest_path,
+        # One event loop and one OpenAI client for all files in the run
+        transcribe_manifests(
+            manifest_paths=[manifest_path for _, manifest_path in jobs],
             config=config,
         )
 
-        full_text, merged_chunks = stitch_outputs(manifest_path)
-        write_side_outputs(out_dir, full_text, merged_chunks, manifest_path, config)
+        for out_dir, manifest_path in jobs:
+            # Parse the manifest once for both stitching and transcript.json
+            manifest = json_loads(manifest_path.read_bytes())
+            full_text, merged_chunks = stitch_outputs(manifest_path, manifest=manifest)
+            write_side_outputs(out_dir, full_text, merged_chunks, manifest_path, config, manifest=manifest)
 
         print(f"\n[SUCCESS] Transcription completed successfully!")
-        print(f"[INFO] Output directory: {out_dir}")
+        for out_dir, _ in jobs:
+            print(f"[INFO] Output directory: {out_dir}")
         print(f"[INFO] Files generated:")
-        if config.outputs.write_txt:
-            print(f"   - transcript.txt")
-        if config.outputs.write_json:
-            print(f"   - transcript.json")
-        if config.outputs.write_srt:
-            print(f"   - transcript.srt")
-        if config.outputs.write_vtt:
-            print(f"   - transcript.vtt")
+        for name in enabled_outputs(config):
+            print(f"   - {name}")
 
     except KeyboardInterrupt:
         print("\n[ERROR] Transcription cancelled by user", file=sys.stderr)
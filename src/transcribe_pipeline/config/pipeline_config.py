@@ -7,20 +7,36 @@ It replaces the previous YAML-based configuration with type-safe, validated Pyth
 The configuration supports CLI overrides and integrates with the logging system.
 """
 
+import logging
 import os
 from pathlib import Path
 from typing import Optional, Dict, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 
+from ..utils.json_utils import json_dumps
 from ..utils.path_utils import get_script_directory
 from ..logging_utils.logging_config import get_logger
 
 
+_LOGGER = get_logger("pipeline_config")
+
+
+# ============================================================================
+# ALLOWED VALUES
+# ============================================================================
+
+_MODEL_CHOICES = frozenset({"gpt-4o-transcribe", "gpt-4o-mini-transcribe"})
+_RESPONSE_FORMATS = frozenset({"json", "text"})
+_CODECS = frozenset({"aac", "libfdk_aac", "mp3", "wav"})
+_SAMPLE_RATES = frozenset({8000, 16000, 22050, 44100, 48000})
+_SEGMENTERS = frozenset({"fixed", "silence"})
+
+
 # ============================================================================
 # NESTED CONFIGURATION CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     """Configuration for OpenAI model and API settings."""
     model: str = "gpt-4o-transcribe"
@@ -30,12 +46,20 @@ class ModelConfig:
     max_retries: int = 3
     backoff_base_ms: int = 800
 
+    @property
+    def backoff_schedule(self) -> tuple:
+        """Exponential backoff cap in seconds for each retry attempt (0-based).
+        
+        Rebuilt on every access; read it once per retry loop.
+        """
+        return tuple((1 << i) * self.backoff_base_ms / 1000.0 for i in range(self.max_retries))
+
     def validate(self) -> None:
         """Validate model configuration settings."""
-        if self.model not in ["gpt-4o-transcribe", "gpt-4o-mini-transcribe"]:
+        if self.model not in _MODEL_CHOICES:
             raise ValueError(f"Invalid model: {self.model}. Must be 'gpt-4o-transcribe' or 'gpt-4o-mini-transcribe'")
         
-        if self.response_format not in ["json", "text"]:
+        if self.response_format not in _RESPONSE_FORMATS:
             raise ValueError(f"Invalid response_format: {self.response_format}. Must be 'json' or 'text'")
         
         if self.parallel_requests < 1 or self.parallel_requests > 10:
@@ -48,7 +72,7 @@ class ModelConfig:
             raise ValueError(f"backoff_base_ms must be between 100 and 5000, got {self.backoff_base_ms}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkingConfig:
     """Configuration for audio chunking policy."""
     max_file_mb: int = 25
@@ -71,7 +95,7 @@ class ChunkingConfig:
             raise ValueError(f"overlap_secs must be between 0 and 30, got {self.overlap_secs}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ReencodeConfig:
     """Configuration for audio re-encoding settings."""
     enabled: bool = True
@@ -82,7 +106,7 @@ class ReencodeConfig:
 
     def validate(self) -> None:
         """Validate re-encoding configuration settings."""
-        if self.codec not in ["aac", "libfdk_aac", "mp3", "wav"]:
+        if self.codec not in _CODECS:
             raise ValueError(f"Invalid codec: {self.codec}. Must be one of: aac, libfdk_aac, mp3, wav")
         
         if self.bitrate_kbps < 32 or self.bitrate_kbps > 320:
@@ -91,11 +115,11 @@ class ReencodeConfig:
         if self.channels < 1 or self.channels > 2:
             raise ValueError(f"channels must be 1 or 2, got {self.channels}")
         
-        if self.sample_rate not in [8000, 16000, 22050, 44100, 48000]:
+        if self.sample_rate not in _SAMPLE_RATES:
             raise ValueError(f"Invalid sample_rate: {self.sample_rate}. Must be one of: 8000, 16000, 22050, 44100, 48000")
 
 
-@dataclass
+@dataclass(slots=True)
 class SilenceConfig:
     """Configuration for silence-based segmentation."""
     min_silence_db: int = -35
@@ -110,7 +134,7 @@ class SilenceConfig:
             raise ValueError(f"min_silence_dur must be between 0.1 and 5.0, got {self.min_silence_dur}")
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputConfig:
     """Configuration for output file generation."""
     write_txt: bool = True
@@ -124,7 +148,7 @@ class OutputConfig:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class PathConfig:
     """Configuration for file and directory paths."""
     input_audio: str = ""
@@ -142,7 +166,7 @@ class PathConfig:
 # MAIN CONFIGURATION CLASS
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     """
     Main configuration class for the transcription pipeline.
@@ -162,11 +186,15 @@ class PipelineConfig:
     # Additional settings
     segmenter: str = "fixed"  # fixed | silence
     
+    @property
+    def logger(self) -> logging.Logger:
+        """Module logger, kept for callers that used the former instance attribute."""
+        return _LOGGER
+    
     def __post_init__(self):
-        """Initialize logger and validate configuration after instantiation."""
-        self.logger = get_logger("pipeline_config")
+        """Validate configuration after instantiation."""
         self.validate()
-        self.logger.debug("PipelineConfig initialized successfully")
+        _LOGGER.debug("PipelineConfig initialized successfully")
 
     def validate(self) -> None:
         """Validate all configuration settings."""
@@ -178,11 +206,11 @@ class PipelineConfig:
             self.outputs.validate()
             self.paths.validate()
             
-            if self.segmenter not in ["fixed", "silence"]:
+            if self.segmenter not in _SEGMENTERS:
                 raise ValueError(f"Invalid segmenter: {self.segmenter}. Must be 'fixed' or 'silence'")
                 
         except Exception as e:
-            self.logger.error(f"Configuration validation failed: {e}")
+            _LOGGER.error("Configuration validation failed: %s", e)
             raise
 
     def to_dict(self) -> Dict[str, Any]:
@@ -222,25 +250,39 @@ class PipelineConfig:
 
     def apply_cli_overrides(self, args) -> None:
         """Apply CLI argument overrides to configuration."""
-        if hasattr(args, 'model') and args.model:
-            self.model.model = args.model
-            self.logger.debug(f"CLI override: model = {args.model}")
+        # One getattr per option; args may be any object, not just a Namespace
+        model = getattr(args, 'model', None)
+        segmenter = getattr(args, 'segmenter', None)
+        prompt = getattr(args, 'prompt', None)
+        work_dir = getattr(args, 'work_dir', None)
+        changed = False
         
-        if hasattr(args, 'segmenter') and args.segmenter:
-            self.segmenter = args.segmenter
-            self.logger.debug(f"CLI override: segmenter = {args.segmenter}")
+        if model:
+            self.model.model = model
+            _LOGGER.debug("CLI override: model = %s", model)
+            changed = True
         
-        if hasattr(args, 'prompt') and args.prompt is not None:
-            self.model.prompt = args.prompt
-            self.logger.debug(f"CLI override: prompt = {args.prompt}")
+        if segmenter:
+            self.segmenter = segmenter
+            _LOGGER.debug("CLI override: segmenter = %s", segmenter)
+            changed = True
         
-        if hasattr(args, 'work_dir') and args.work_dir:
-            self.paths.work_dir = args.work_dir
-            self.logger.debug(f"CLI override: work_dir = {args.work_dir}")
+        if prompt is not None:
+            self.model.prompt = prompt
+            _LOGGER.debug("CLI override: prompt = %s", prompt)
+            changed = True
         
-        # Re-validate after applying overrides
+        if work_dir:
+            self.paths.work_dir = work_dir
+            _LOGGER.debug("CLI override: work_dir = %s", work_dir)
+            changed = True
+        
+        # Re-validate only if an override was applied
+        if not changed:
+            _LOGGER.debug("No CLI overrides to apply")
+            return
         self.validate()
-        self.logger.info("CLI overrides applied and validated successfully")
+        _LOGGER.info("CLI overrides applied and validated successfully")
 
     def get_input_audio_path(self, cli_input: Optional[str] = None) -> Path:
         """Get the input audio path, prioritizing CLI argument over config."""
@@ -260,26 +302,27 @@ class PipelineConfig:
         return Path(work_dir).expanduser().resolve()
 
     def save_effective_config(self, output_dir: Path) -> None:
-        """Save the effective configuration (including CLI overrides) to a file."""
+        """Save the effective configuration (including CLI overrides) to a file.
+        
+        The JSON is serialized straight to UTF-8 bytes, skipping the str step.
+        """
         effective_config = self.to_dict()
         config_file = output_dir / "effective_config.json"
         
-        import json
-        config_file.write_text(
-            json.dumps(effective_config, indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
+        config_file.write_bytes(json_dumps(effective_config))
         
-        self.logger.debug(f"Effective configuration saved to: {config_file}")
+        _LOGGER.debug("Effective configuration saved to: %s", config_file)
 
     def log_configuration(self) -> None:
         """Log the current configuration for debugging purposes."""
-        self.logger.debug("Current pipeline configuration:")
-        self.logger.debug(f"  Model: {self.model.model} ({self.model.response_format})")
-        self.logger.debug(f"  Chunking: {self.chunking.target_chunk_mb}MB target, {self.chunking.max_chunk_secs}s max")
-        self.logger.debug(f"  Segmenter: {self.segmenter}")
-        self.logger.debug(f"  Re-encoding: {'enabled' if self.reencode.enabled else 'disabled'}")
-        self.logger.debug(f"  Outputs: txt={self.outputs.write_txt}, json={self.outputs.write_json}, srt={self.outputs.write_srt}, vtt={self.outputs.write_vtt}")
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return  # skip building the summary lines below
+        _LOGGER.debug("Current pipeline configuration:")
+        _LOGGER.debug(f"  Model: {self.model.model} ({self.model.response_format})")
+        _LOGGER.debug(f"  Chunking: {self.chunking.target_chunk_mb}MB target, {self.chunking.max_chunk_secs}s max")
+        _LOGGER.debug(f"  Segmenter: {self.segmenter}")
+        _LOGGER.debug(f"  Re-encoding: {'enabled' if self.reencode.enabled else 'disabled'}")
+        _LOGGER.debug(f"  Outputs: txt={self.outputs.write_txt}, json={self.outputs.write_json}, srt={self.outputs.write_srt}, vtt={self.outputs.write_vtt}")
 
 
 # ============================================================================
@@ -291,77 +334,38 @@ def create_default_config() -> PipelineConfig:
     return PipelineConfig()
 
 
+# Keys of the to_dict() schema, mapped onto the nested config they update.
+# Model, chunking and path settings are flat keys; the rest are sub-dicts.
+_FLAT_KEYS = {
+    name: group
+    for group, cls in (("model", ModelConfig), ("chunking", ChunkingConfig), ("paths", PathConfig))
+    for name in (f.name for f in fields(cls))
+}
+_NESTED_KEYS = {
+    group: frozenset(f.name for f in fields(cls))
+    for group, cls in (("reencode", ReencodeConfig), ("silence", SilenceConfig), ("outputs", OutputConfig))
+}
+
+
 def create_config_from_dict(config_dict: Dict[str, Any]) -> PipelineConfig:
     """Create a PipelineConfig instance from a dictionary."""
     config = PipelineConfig()
     
-    # Update model settings
-    if "model" in config_dict:
-        config.model.model = config_dict["model"]
-    if "response_format" in config_dict:
-        config.model.response_format = config_dict["response_format"]
-    if "prompt" in config_dict:
-        config.model.prompt = config_dict["prompt"]
-    if "parallel_requests" in config_dict:
-        config.model.parallel_requests = config_dict["parallel_requests"]
-    if "max_retries" in config_dict:
-        config.model.max_retries = config_dict["max_retries"]
-    if "backoff_base_ms" in config_dict:
-        config.model.backoff_base_ms = config_dict["backoff_base_ms"]
-    
-    # Update chunking settings
-    if "max_file_mb" in config_dict:
-        config.chunking.max_file_mb = config_dict["max_file_mb"]
-    if "target_chunk_mb" in config_dict:
-        config.chunking.target_chunk_mb = config_dict["target_chunk_mb"]
-    if "max_chunk_secs" in config_dict:
-        config.chunking.max_chunk_secs = config_dict["max_chunk_secs"]
-    if "overlap_secs" in config_dict:
-        config.chunking.overlap_secs = config_dict["overlap_secs"]
-    
-    # Update re-encoding settings
-    if "reencode" in config_dict:
-        reencode_dict = config_dict["reencode"]
-        if "enabled" in reencode_dict:
-            config.reencode.enabled = reencode_dict["enabled"]
-        if "codec" in reencode_dict:
-            config.reencode.codec = reencode_dict["codec"]
-        if "bitrate_kbps" in reencode_dict:
-            config.reencode.bitrate_kbps = reencode_dict["bitrate_kbps"]
-        if "channels" in reencode_dict:
-            config.reencode.channels = reencode_dict["channels"]
-        if "sample_rate" in reencode_dict:
-            config.reencode.sample_rate = reencode_dict["sample_rate"]
-    
-    # Update segmenter
-    if "segmenter" in config_dict:
-        config.segmenter = config_dict["segmenter"]
-    
-    # Update silence settings
-    if "silence" in config_dict:
-        silence_dict = config_dict["silence"]
-        if "min_silence_db" in silence_dict:
-            config.silence.min_silence_db = silence_dict["min_silence_db"]
-        if "min_silence_dur" in silence_dict:
-            config.silence.min_silence_dur = silence_dict["min_silence_dur"]
-    
-    # Update output settings
-    if "outputs" in config_dict:
-        outputs_dict = config_dict["outputs"]
-        if "write_txt" in outputs_dict:
-            config.outputs.write_txt = outputs_dict["write_txt"]
-        if "write_json" in outputs_dict:
-            config.outputs.write_json = outputs_dict["write_json"]
-        if "write_srt" in outputs_dict:
-            config.outputs.write_srt = outputs_dict["write_srt"]
-        if "write_vtt" in outputs_dict:
-            config.outputs.write_vtt = outputs_dict["write_vtt"]
+    # Collect overrides per nested config in one pass; unknown keys are ignored
+    updates: Dict[str, Dict[str, Any]] = {}
+    for key, value in config_dict.items():
+        if key in _FLAT_KEYS:
+            updates.setdefault(_FLAT_KEYS[key], {})[key] = value
+        elif key in _NESTED_KEYS:
+            allowed = _NESTED_KEYS[key]
+            updates.setdefault(key, {}).update(
+                (name, v) for name, v in value.items() if name in allowed
+            )
+        elif key == "segmenter":
+            config.segmenter = value
     
-    # Update path settings
-    if "input_audio" in config_dict:
-        config.paths.input_audio = config_dict["input_audio"]
-    if "work_dir" in config_dict:
-        config.paths.work_dir = config_dict["work_dir"]
+    for group, values in updates.items():
+        setattr(config, group, replace(getattr(config, group), **values))
     
     config.validate()
     return config
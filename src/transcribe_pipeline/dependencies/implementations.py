@@ -5,13 +5,15 @@ This module provides real implementations of the dependency interfaces
 for use in production code.
 """
 
+import asyncio
 import os
 import time
 import subprocess
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from .interfaces import (
     SubprocessProvider,
@@ -22,43 +24,73 @@ from .interfaces import (
 )
 
 
+# HTTP settings for the shared OpenAI connection pool
+HTTP_TIMEOUT = httpx.Timeout(1800.0, connect=10.0)  # long uploads, fast connect failure
+HTTP_KEEPALIVE_EXPIRY_SECS = 600
+
+
 class RealSubprocessProvider(SubprocessProvider):
     """Real implementation of subprocess operations."""
     
     def run(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
         """Run a subprocess command with real subprocess."""
+        # ffmpeg/ffprobe must never inherit (and wait on) the terminal's stdin
+        if "input" not in kwargs:
+            kwargs.setdefault("stdin", subprocess.DEVNULL)
         return subprocess.run(cmd, **kwargs)
 
 
 class RealOpenAIClientProvider(OpenAIClientProvider):
     """Real implementation of OpenAI API operations."""
     
-    def create_client(self, api_key: str) -> Any:
-        """Create a real OpenAI client instance."""
-        return OpenAI(api_key=api_key)
+    def create_client(self, api_key: str, max_connections: int = 10) -> Any:
+        """Create a real asynchronous OpenAI client over a shared HTTP/2 pool."""
+        # Size the pool for the request fan-out so every upload reuses a
+        # warm (multiplexed) connection instead of paying a new TLS handshake.
+        pool_size = max_connections * 2
+        http_client = DefaultAsyncHttpxClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECS,
+            ),
+            timeout=HTTP_TIMEOUT,
+        )
+        return AsyncOpenAI(api_key=api_key, http_client=http_client)
     
-    def transcribe_audio(self, client: Any, audio_file: Path, model: str, 
-                        response_format: str, prompt: Optional[str] = None) -> Dict[str, Any]:
+    async def close_client(self, client: Any) -> None:
+        """Close the real OpenAI client and its HTTP connection pool."""
+        await client.close()
+    
+    async def transcribe_audio(self, client: Any, audio_file: Path, model: str, 
+                              response_format: str, prompt: Optional[str] = None) -> Dict[str, Any]:
         """Transcribe audio using real OpenAI API."""
-        with open(audio_file, "rb") as f:
-            resp = client.audio.transcriptions.create(
-                model=model,
-                file=f,
-                response_format=response_format,
-                prompt=prompt if prompt else None,
-            )
+        # Per-request overrides (timeout=, extra_headers=) belong on this call;
+        # keep client.with_options() off the hot path so every chunk goes
+        # through the one pooled client built in create_client().
+        # Pass the path, not an open handle or mmap: the async SDK reads a
+        # path whole (anyio.Path.read_bytes) in a worker thread, so each
+        # in-flight upload holds one copy of its chunk. httpx's async
+        # multipart encoder would read a sync handle on the event loop and
+        # stall every other in-flight upload.
+        resp = await client.audio.transcriptions.create(
+            model=model,
+            file=Path(audio_file),
+            response_format=response_format,
+            prompt=prompt if prompt else None,
+        )
         
-        # Normalize to dict
-        if hasattr(resp, "model_dump"):
-            data = resp.model_dump()
+        # Normalize to dict; only the text is used, so read it directly
+        # instead of serializing the whole response model
+        if isinstance(resp, str):
+            text = resp  # response_format="text" returns a plain string
         else:
-            import json
-            try:
-                data = json.loads(str(resp))
-            except Exception:
-                data = {"text": getattr(resp, "text", str(resp))}
+            text = getattr(resp, "text", None)
+            if text is None:
+                text = str(resp)
         
-        return data
+        return {"text": text}
 
 
 class RealFileSystemProvider(FileSystemProvider):
@@ -69,8 +101,22 @@ class RealFileSystemProvider(FileSystemProvider):
         return path.read_text(encoding=encoding)
     
     def write_text(self, path: Path, content: str, encoding: str = "utf-8") -> None:
-        """Write text to a real file."""
-        path.write_text(content, encoding=encoding)
+        """Write text to a real file atomically (temp file + rename)."""
+        # Readers never observe a half-written file if we crash mid-write
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(content, encoding=encoding)
+        os.replace(tmp_path, path)
+    
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        """Write binary data to a real file atomically (temp file + rename)."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    
+    def append_bytes(self, path: Path, data: bytes) -> None:
+        """Append binary data to a real file."""
+        with open(path, "ab") as f:
+            f.write(data)
     
     def read_binary(self, path: Path) -> bytes:
         """Read binary data from a real file."""
@@ -92,10 +138,18 @@ class RealTimeProvider(TimeProvider):
         """Get real current time."""
         return time.time()
     
+    def monotonic(self) -> float:
+        """Get real monotonic clock reading."""
+        return time.monotonic()
+    
     def sleep(self, seconds: float) -> None:
         """Real sleep operation."""
         time.sleep(seconds)
     
+    async def sleep_async(self, seconds: float) -> None:
+        """Real non-blocking sleep operation."""
+        await asyncio.sleep(seconds)
+    
     def strftime(self, format_str: str) -> str:
         """Format real current time."""
         return time.strftime(format_str)
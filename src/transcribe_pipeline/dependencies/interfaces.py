@@ -15,6 +15,8 @@ import subprocess
 class SubprocessProvider(ABC):
     """Interface for subprocess operations (FFmpeg calls)."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def run(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
         """
@@ -36,22 +38,39 @@ class SubprocessProvider(ABC):
 class OpenAIClientProvider(ABC):
     """Interface for OpenAI API operations."""
     
+    __slots__ = ()
+    
     @abstractmethod
-    def create_client(self, api_key: str) -> Any:
+    def create_client(self, api_key: str, max_connections: int = 10) -> Any:
         """
-        Create an OpenAI client instance.
+        Create an asynchronous OpenAI client instance.
+        
+        The client is created once per run and shared by all requests.
         
         Args:
             api_key: OpenAI API key
+            max_connections: Expected number of concurrent requests
             
         Returns:
-            OpenAI client instance
+            AsyncOpenAI client instance
+        """
+        pass
+    
+    @abstractmethod
+    async def close_client(self, client: Any) -> None:
+        """
+        Close an OpenAI client and release its connection pool.
+        
+        Must be awaited on the same event loop that used the client.
+        
+        Args:
+            client: OpenAI client instance
         """
         pass
     
     @abstractmethod
-    def transcribe_audio(self, client: Any, audio_file: Path, model: str, 
-                        response_format: str, prompt: Optional[str] = None) -> Dict[str, Any]:
+    async def transcribe_audio(self, client: Any, audio_file: Path, model: str, 
+                              response_format: str, prompt: Optional[str] = None) -> Dict[str, Any]:
         """
         Transcribe audio using OpenAI API.
         
@@ -74,6 +93,8 @@ class OpenAIClientProvider(ABC):
 class FileSystemProvider(ABC):
     """Interface for file system operations."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def read_text(self, path: Path, encoding: str = "utf-8") -> str:
         """
@@ -100,6 +121,28 @@ class FileSystemProvider(ABC):
         """
         pass
     
+    @abstractmethod
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        """
+        Write binary data to a file.
+        
+        Args:
+            path: Path to file
+            data: Bytes to write
+        """
+        pass
+    
+    @abstractmethod
+    def append_bytes(self, path: Path, data: bytes) -> None:
+        """
+        Append binary data to a file, creating it if necessary.
+        
+        Args:
+            path: Path to file
+            data: Bytes to append
+        """
+        pass
+    
     @abstractmethod
     def read_binary(self, path: Path) -> bytes:
         """
@@ -142,6 +185,8 @@ class FileSystemProvider(ABC):
 class TimeProvider(ABC):
     """Interface for time-related operations."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def time(self) -> float:
         """
@@ -152,6 +197,16 @@ class TimeProvider(ABC):
         """
         pass
     
+    @abstractmethod
+    def monotonic(self) -> float:
+        """
+        Get a monotonic clock reading for measuring intervals.
+        
+        Returns:
+            Monotonic clock value in seconds
+        """
+        pass
+    
     @abstractmethod
     def sleep(self, seconds: float) -> None:
         """
@@ -162,6 +217,16 @@ class TimeProvider(ABC):
         """
         pass
     
+    @abstractmethod
+    async def sleep_async(self, seconds: float) -> None:
+        """
+        Sleep for specified seconds without blocking the event loop.
+        
+        Args:
+            seconds: Seconds to sleep
+        """
+        pass
+    
     @abstractmethod
     def strftime(self, format_str: str) -> str:
         """
@@ -179,6 +244,8 @@ class TimeProvider(ABC):
 class EnvironmentProvider(ABC):
     """Interface for environment variable access."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """
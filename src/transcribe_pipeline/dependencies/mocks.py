@@ -6,10 +6,12 @@ for use in unit testing. These mocks allow for controlled testing
 without external dependencies.
 """
 
+import asyncio
 import subprocess
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from unittest.mock import Mock
 
 from .interfaces import (
     SubprocessProvider,
@@ -23,37 +25,48 @@ from .interfaces import (
 class MockSubprocessProvider(SubprocessProvider):
     """Mock implementation of subprocess operations for testing."""
     
+    __slots__ = ("commands_run", "results", "default_result")
+    
     def __init__(self):
         self.commands_run = []
-        self.results = {}  # cmd_str -> result mapping
+        self.results = {}  # tuple(cmd) -> result mapping
         self.default_result = subprocess.CompletedProcess(
             args=[], returncode=0, stdout=b"", stderr=b""
         )
     
     def set_result(self, cmd: List[str], result: subprocess.CompletedProcess):
         """Set expected result for a command."""
-        cmd_str = " ".join(cmd)
-        self.results[cmd_str] = result
+        self.results[tuple(cmd)] = result
     
     def run(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
         """Run a mock subprocess command."""
-        cmd_str = " ".join(cmd)
         self.commands_run.append((cmd, kwargs))
-        
-        if cmd_str in self.results:
-            return self.results[cmd_str]
-        
-        return self.default_result
+        return self.results.get(tuple(cmd), self.default_result)
+
+
+@dataclass(slots=True)
+class _FakeOpenAIClient:
+    """Stand-in client handed out by MockOpenAIClientProvider."""
+    api_key: str
+    max_connections: int  # pool size the real client would be built with
 
 
 class MockOpenAIClientProvider(OpenAIClientProvider):
     """Mock implementation of OpenAI API operations for testing."""
     
+    __slots__ = (
+        "clients_created", "clients_closed", "transcription_calls", "transcriptions",
+        "default_transcription", "transcription_errors", "transcription_delays",
+    )
+    
     def __init__(self):
         self.clients_created = []
+        self.clients_closed = []
+        self.transcription_calls = []  # (client, file_path) per request
         self.transcriptions = {}  # file_path -> result mapping
         self.default_transcription = {"text": "Mock transcription text"}
         self.transcription_errors = {}  # file_path -> exception mapping
+        self.transcription_delays = {}  # file_path -> seconds to wait before responding
     
     def set_transcription_result(self, audio_file: Path, result: Dict[str, Any]):
         """Set expected transcription result for an audio file."""
@@ -63,17 +76,28 @@ class MockOpenAIClientProvider(OpenAIClientProvider):
         """Set expected transcription error for an audio file."""
         self.transcription_errors[str(audio_file)] = exception
     
-    def create_client(self, api_key: str) -> Any:
+    def set_transcription_delay(self, audio_file: Path, seconds: float):
+        """Delay the response for an audio file (to reorder completions)."""
+        self.transcription_delays[str(audio_file)] = seconds
+    
+    def create_client(self, api_key: str, max_connections: int = 10) -> Any:
         """Create a mock OpenAI client."""
-        mock_client = Mock()
-        mock_client.api_key = api_key
-        self.clients_created.append((api_key, mock_client))
-        return mock_client
+        client = _FakeOpenAIClient(api_key=api_key, max_connections=max_connections)
+        self.clients_created.append((api_key, client))
+        return client
     
-    def transcribe_audio(self, client: Any, audio_file: Path, model: str, 
-                        response_format: str, prompt: Optional[str] = None) -> Dict[str, Any]:
+    async def close_client(self, client: Any) -> None:
+        """Mock client close (just record the call)."""
+        self.clients_closed.append(client)
+    
+    async def transcribe_audio(self, client: Any, audio_file: Path, model: str, 
+                              response_format: str, prompt: Optional[str] = None) -> Dict[str, Any]:
         """Mock transcription operation."""
         file_key = str(audio_file)
+        self.transcription_calls.append((client, file_key))
+        
+        if file_key in self.transcription_delays:
+            await asyncio.sleep(self.transcription_delays[file_key])
         
         # Check for expected error
         if file_key in self.transcription_errors:
@@ -86,18 +110,21 @@ class MockOpenAIClientProvider(OpenAIClientProvider):
 class MockFileSystemProvider(FileSystemProvider):
     """Mock implementation of file system operations for testing."""
     
+    __slots__ = ("entries", "file_errors")
+    
     def __init__(self):
-        self.files = {}  # path -> content mapping
-        self.directories = set()  # set of directory paths
+        # One namespace for files and directories so exists() is a single
+        # lookup; a directory is stored as None, a file as its str/bytes content
+        self.entries = {}  # path -> content mapping
         self.file_errors = {}  # path -> exception mapping
     
     def set_file_content(self, path: Path, content: str):
         """Set file content for testing."""
-        self.files[str(path)] = content
+        self.entries[str(path)] = content
     
     def set_binary_content(self, path: Path, content: bytes):
         """Set binary file content for testing."""
-        self.files[str(path)] = content
+        self.entries[str(path)] = content
     
     def set_file_error(self, path: Path, exception: Exception):
         """Set expected file operation error."""
@@ -105,19 +132,26 @@ class MockFileSystemProvider(FileSystemProvider):
     
     def add_directory(self, path: Path):
         """Add a directory for testing."""
-        self.directories.add(str(path))
+        self.entries[str(path)] = None
     
-    def read_text(self, path: Path, encoding: str = "utf-8") -> str:
-        """Mock read text operation."""
+    def _read(self, path: Path):
+        """Return stored file content, raising like the real filesystem."""
         path_str = str(path)
         
         if path_str in self.file_errors:
             raise self.file_errors[path_str]
         
-        if path_str not in self.files:
+        if path_str not in self.entries:
             raise FileNotFoundError(f"File not found: {path}")
         
-        content = self.files[path_str]
+        content = self.entries[path_str]
+        if content is None:
+            raise IsADirectoryError(f"Is a directory: {path}")
+        return content
+    
+    def read_text(self, path: Path, encoding: str = "utf-8") -> str:
+        """Mock read text operation."""
+        content = self._read(path)
         if isinstance(content, bytes):
             return content.decode(encoding)
         return content
@@ -129,27 +163,39 @@ class MockFileSystemProvider(FileSystemProvider):
         if path_str in self.file_errors:
             raise self.file_errors[path_str]
         
-        self.files[path_str] = content
+        self.entries[path_str] = content
     
-    def read_binary(self, path: Path) -> bytes:
-        """Mock read binary operation."""
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        """Mock write binary operation."""
         path_str = str(path)
         
         if path_str in self.file_errors:
             raise self.file_errors[path_str]
         
-        if path_str not in self.files:
-            raise FileNotFoundError(f"File not found: {path}")
+        self.entries[path_str] = data
+    
+    def append_bytes(self, path: Path, data: bytes) -> None:
+        """Mock append binary operation."""
+        path_str = str(path)
         
-        content = self.files[path_str]
+        if path_str in self.file_errors:
+            raise self.file_errors[path_str]
+        
+        existing = self.entries.get(path_str) or b""
+        if isinstance(existing, str):
+            existing = existing.encode()
+        self.entries[path_str] = existing + data
+    
+    def read_binary(self, path: Path) -> bytes:
+        """Mock read binary operation."""
+        content = self._read(path)
         if isinstance(content, str):
             return content.encode()
         return content
     
     def exists(self, path: Path) -> bool:
         """Mock exists check."""
-        path_str = str(path)
-        return path_str in self.files or path_str in self.directories
+        return str(path) in self.entries
     
     def mkdir(self, path: Path, parents: bool = False, exist_ok: bool = False) -> None:
         """Mock directory creation."""
@@ -158,19 +204,24 @@ class MockFileSystemProvider(FileSystemProvider):
         if path_str in self.file_errors:
             raise self.file_errors[path_str]
         
-        if not exist_ok and path_str in self.directories:
-            raise FileExistsError(f"Directory exists: {path}")
+        if path_str in self.entries:
+            if not exist_ok or self.entries[path_str] is not None:
+                raise FileExistsError(f"Directory exists: {path}")
+            return
         
-        self.directories.add(path_str)
+        self.entries[path_str] = None
 
 
 class MockTimeProvider(TimeProvider):
     """Mock implementation of time operations for testing."""
     
+    __slots__ = ("current_time", "sleep_calls", "strftime_calls", "_localtime")
+    
     def __init__(self):
         self.current_time = 1234567890.0  # Fixed time for testing
         self.sleep_calls = []
         self.strftime_calls = []
+        self._localtime = (None, None)  # (current_time, struct_time) of last strftime
     
     def set_time(self, time_value: float):
         """Set current time for testing."""
@@ -180,20 +231,33 @@ class MockTimeProvider(TimeProvider):
         """Mock current time."""
         return self.current_time
     
+    def monotonic(self) -> float:
+        """Mock monotonic clock (follows the fixed current time)."""
+        return self.current_time
+    
     def sleep(self, seconds: float) -> None:
         """Mock sleep operation (just record the call)."""
         self.sleep_calls.append(seconds)
     
+    async def sleep_async(self, seconds: float) -> None:
+        """Mock non-blocking sleep operation (just record the call)."""
+        self.sleep_calls.append(seconds)
+    
     def strftime(self, format_str: str) -> str:
         """Mock strftime operation."""
         self.strftime_calls.append(format_str)
-        import time
-        return time.strftime(format_str, time.localtime(self.current_time))
+        cached_time, local = self._localtime
+        if cached_time != self.current_time:
+            local = time.localtime(self.current_time)
+            self._localtime = (self.current_time, local)
+        return time.strftime(format_str, local)
 
 
 class MockEnvironmentProvider(EnvironmentProvider):
     """Mock implementation of environment variable access for testing."""
     
+    __slots__ = ("variables", "required_errors")
+    
     def __init__(self):
         self.variables = {}  # key -> value mapping
         self.required_errors = {}  # key -> exception mapping
@@ -8,47 +8,227 @@ The configuration allows each module/function to have its own logger with
 independent settings.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
-LOGGING_CONFIG = {
+@dataclass(frozen=True, slots=True)
+class LoggerSpec:
+    """Settings for one named logger (empty log_filename means ``<name>.log``)."""
+    level: str = "INFO"
+    log_filename: str = ""
+    console_output: bool = True
+    file_output: bool = False
+
+
+LOGGING_CONFIG: Dict[str, LoggerSpec] = {
     # Main CLI logger - used by transcribe_cli.py
-    "transcribe_cli": {
-        "level": "INFO",  # Default level (can be overridden by --debug flag)
-        "log_filename": "transcribe_cli.log",
-        "console_output": True,
-        "file_output": True,
-    },
+    "transcribe_cli": LoggerSpec(
+        level="INFO",  # Default level (can be overridden by --debug flag)
+        log_filename="transcribe_cli.log",
+        console_output=True,
+        file_output=True,
+    ),
     
     # Core transcription logger
-    "transcription": {
-        "level": "DEBUG",
-        "log_filename": "transcription.log",
-        "console_output": True,
-        "file_output": True,
-    },
+    "transcription": LoggerSpec(
+        level="DEBUG",
+        log_filename="transcription.log",
+        console_output=True,
+        file_output=True,
+    ),
     
     # Language detection logger
-    "language_detection": {
-        "level": "DEBUG",
-        "log_filename": "language_detection.log",
-        "console_output": True,
-        "file_output": True,
-    },
+    "language_detection": LoggerSpec(
+        level="DEBUG",
+        log_filename="language_detection.log",
+        console_output=True,
+        file_output=True,
+    ),
 }
 
+# Settings for loggers without an entry in LOGGING_CONFIG
+_DEFAULT_SPEC = LoggerSpec()
+
 # ============================================================================
 # DEFAULT SETTINGS
 # ============================================================================
 DEFAULT_LOG_DIR = "logs"  # Default log directory (relative to CWD or configurable)
 DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+FILE_BUFFER_CAPACITY = 512  # records held before one batched file write
+
+# Level names accepted by get_logger/set_console_level, in either case
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+_LEVELS.update({name.lower(): value for name, value in _LEVELS.items()})
+
+
+# Loggers already configured by get_logger, by name (its fast path)
+_LOGGERS: Dict[str, logging.Logger] = {}
+
+# Handlers that write each configured logger's records, by logger name
+_OUTPUTS: Dict[str, tuple] = {}
+
+# Console handler of each configured logger, so set_console_level needs no scan
+_CONSOLE_HANDLERS: Dict[str, logging.StreamHandler] = {}
+
+# One queue and one listener thread serve every configured logger
+_QUEUE = queue.SimpleQueue()
+_LISTENER_LOCK = threading.Lock()
+_LISTENER_STARTED = threading.Event()
+
+
+class _RoutingListener(logging.handlers.QueueListener):
+    """Shared listener that hands each record to its own logger's outputs."""
+    
+    def handle(self, item) -> None:
+        name, record = item
+        for handler in _OUTPUTS.get(name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+_LISTENER = _RoutingListener(_QUEUE)
+
+
+class _RoutedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler tagging records with its logger's name for the shared listener.
+    
+    The listener thread is started by the first record rather than at
+    ``get_logger`` time, so modules that build a logger on import but never
+    log start no thread.
+    """
+    
+    def __init__(self, owner: str):
+        super().__init__(_QUEUE)
+        self.owner = owner
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if not _LISTENER_STARTED.is_set():
+            _start_listener()
+        self.queue.put_nowait((self.owner, record))
+
+
+def _start_listener() -> None:
+    with _LISTENER_LOCK:
+        if not _LISTENER_STARTED.is_set():
+            _LISTENER.start()
+            _LISTENER_STARTED.set()
+
+
+def _drain_listener() -> None:
+    """Handle every queued record and stop the listener (the next record restarts it)."""
+    with _LISTENER_LOCK:
+        if _LISTENER_STARTED.is_set():
+            _LISTENER.stop()
+            _LISTENER_STARTED.clear()
+
+
+def _stop_listener() -> None:
+    """Flush queued and buffered records and stop the listener thread (runs at exit)."""
+    _drain_listener()
+    for handlers in _OUTPUTS.values():
+        for handler in handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                pass  # stream already closed, as in logging.shutdown()
+
+
+atexit.register(_stop_listener)
+
+
+def _close_handler(handler: logging.Handler) -> None:
+    """Close a handler and, for a buffered one, the file it writes to."""
+    target = getattr(handler, "target", None)
+    handler.close()  # a buffered handler flushes on close
+    if target is not None:
+        target.close()
+
+
+def _reset_for_tests(keep=()) -> None:
+    """Unconfigure every logger built by get_logger except those named in keep.
+    
+    The test suite calls this after each test so module-level caches here
+    never carry one test's handlers (or open log files) into the next.
+    """
+    names = [n for n in _LOGGERS if n not in keep]
+    if names:
+        _drain_listener()
+    for name in names:
+        logger = _LOGGERS.pop(name)
+        for handler in _OUTPUTS.pop(name, ()):
+            _close_handler(handler)
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers.clear()
+        _CONSOLE_HANDLERS.pop(name, None)
+
+
+def _is_file_handler(handler: logging.Handler) -> bool:
+    """Whether a handler writes to a log file (directly or through a buffer)."""
+    if isinstance(handler, logging.handlers.MemoryHandler):
+        handler = handler.target
+    return isinstance(handler, logging.FileHandler)
+
+
+def _output_handlers(logger: logging.Logger) -> tuple:
+    """Return the handlers that actually write a logger's records."""
+    outputs = _OUTPUTS.get(logger.name)
+    if outputs is not None:
+        return outputs
+    return tuple(logger.handlers)
+
+
+def _sync_logger_level(logger: logging.Logger) -> None:
+    """Set the logger's level to the lowest level any of its outputs accepts.
+    
+    Calls below that level (e.g. ``logger.debug`` with only INFO outputs)
+    then return in ``isEnabledFor`` before a record is even created.
+    """
+    handlers = _output_handlers(logger)
+    if handlers:
+        logger.setLevel(min(h.level for h in handlers))
+    elif logger.name in _OUTPUTS:
+        # Every output was detached, so no record would be written at all
+        logger.setLevel(logging.CRITICAL + 1)
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders each second's timestamp only once.
+    
+    DEFAULT_DATE_FORMAT has one-second resolution, so all records logged
+    within the same second share one ``asctime`` string instead of each
+    paying for ``localtime()`` + ``strftime()``.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt is None:
+            return super().formatTime(record, datefmt)  # includes milliseconds
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._cached_time = (second, text)
+        return text
 
 
 def get_logger(
@@ -62,7 +242,10 @@ def get_logger(
     
     This function creates a logger with both console and file handlers based on
     the configuration defined in LOGGING_CONFIG. If the logger already exists,
-    it returns the existing instance.
+    it returns the existing instance. The handlers run on one background
+    listener thread shared by all loggers and started by the first logged
+    record, so logging calls only enqueue the record and never block on
+    console or disk writes.
     
     Args:
         logger_name: Name of the logger (must match a key in LOGGING_CONFIG)
@@ -78,11 +261,15 @@ def get_logger(
         >>> logger.info('Starting transcription...')
         >>> logger.debug('Detailed debug information')
     """
+    logger = _LOGGERS.get(logger_name)
+    if logger is not None:
+        return logger
+    
     # Get configuration for this logger
-    config = LOGGING_CONFIG.get(logger_name, {})
+    spec = LOGGING_CONFIG.get(logger_name, _DEFAULT_SPEC)
     
     # Use provided levels or fall back to config
-    default_level = config.get("level", "INFO")
+    default_level = spec.level
     console_level = console_level or default_level
     file_level = file_level or default_level
     
@@ -91,24 +278,28 @@ def get_logger(
     
     # Only configure if not already configured (avoid duplicate handlers)
     if not logger.handlers:
-        logger.setLevel(logging.DEBUG)  # Set to DEBUG to allow handlers to filter
+        logger.setLevel(logging.DEBUG)  # Narrowed to the handlers' levels below
         logger.propagate = False  # Don't propagate to root logger
+        _CONSOLE_HANDLERS.pop(logger_name, None)  # drop any stale handler
+        
+        handlers = []
         
         # Create formatters
-        formatter = logging.Formatter(
+        formatter = _CachedTimeFormatter(
             fmt=DEFAULT_LOG_FORMAT,
             datefmt=DEFAULT_DATE_FORMAT
         )
         
         # Console handler (if enabled in config)
-        if config.get("console_output", True):
+        if spec.console_output:
             console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(getattr(logging, console_level.upper()))
+            console_handler.setLevel(_LEVELS[console_level])
             console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
+            _CONSOLE_HANDLERS[logger_name] = console_handler
         
         # File handler (if enabled in config)
-        if config.get("file_output", False):
+        if spec.file_output:
             # Determine log directory
             if log_dir is None:
                 log_dir = Path.cwd() / DEFAULT_LOG_DIR
@@ -119,14 +310,30 @@ def get_logger(
             log_dir.mkdir(parents=True, exist_ok=True)
             
             # Get log filename from config
-            log_filename = config.get("log_filename", f"{logger_name}.log")
+            log_filename = spec.log_filename or f"{logger_name}.log"
             log_file = log_dir / log_filename
             
             # Create file handler
             file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(getattr(logging, file_level.upper()))
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            
+            # Buffer records so many lines go out in one write; warnings and
+            # errors flush immediately. The level is checked on the buffer,
+            # since flushing hands records to the target unfiltered.
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=FILE_BUFFER_CAPACITY,
+                flushLevel=logging.WARNING,
+                target=file_handler,
+                flushOnClose=True,
+            )
+            buffered_handler.setLevel(_LEVELS[file_level])
+            handlers.append(buffered_handler)
+        
+        if handlers:
+            _OUTPUTS[logger_name] = tuple(handlers)
+            logger.addHandler(_RoutedQueueHandler(logger_name))
+            _sync_logger_level(logger)
+        _LOGGERS[logger_name] = logger
     
     return logger
 
@@ -146,11 +353,17 @@ def set_console_level(logger: logging.Logger, level: str) -> None:
         >>> logger = get_logger('transcribe_cli')
         >>> set_console_level(logger, 'DEBUG')  # Enable debug output
     """
-    log_level = getattr(logging, level.upper())
-    for handler in logger.handlers:
-        if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
-            handler.setLevel(log_level)
-            break
+    log_level = _LEVELS[level]
+    console_handler = _CONSOLE_HANDLERS.get(logger.name)
+    if console_handler is not None:
+        console_handler.setLevel(log_level)
+    else:
+        # Logger not built by get_logger: find its stdout handler
+        for handler in _output_handlers(logger):
+            if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
+                handler.setLevel(log_level)
+                break
+    _sync_logger_level(logger)
 
 
 def disable_file_logging(logger: logging.Logger) -> None:
@@ -160,7 +373,21 @@ def disable_file_logging(logger: logging.Logger) -> None:
     Args:
         logger: Logger instance to modify
     """
-    for handler in logger.handlers[:]:  # Use slice to iterate over copy
+    outputs = _OUTPUTS.get(logger.name)
+    if outputs is not None:
+        # Write out queued records before detaching; the next record restarts the listener
+        _drain_listener()
+        file_handlers = [h for h in outputs if _is_file_handler(h)]
+        _OUTPUTS[logger.name] = tuple(h for h in outputs if h not in file_handlers)
+        for handler in file_handlers:
+            _close_handler(handler)
+        _sync_logger_level(logger)  # the file level may have been the lowest
+        return
+    
+    # Walk backwards so removing in place never skips a handler;
+    # removeHandler takes the logging lock that a bare del would bypass
+    for i in range(len(logger.handlers) - 1, -1, -1):
+        handler = logger.handlers[i]
         if isinstance(handler, logging.FileHandler):
             handler.close()
             logger.removeHandler(handler)
@@ -1,10 +1,13 @@
 """Utility functions for transcription pipeline."""
 
 from .path_utils import resolve_path, ensure_directory, get_script_directory, get_relative_path
+from .json_utils import json_dumps, json_loads
 
 __all__ = [
     "resolve_path",
     "ensure_directory", 
     "get_script_directory",
     "get_relative_path",
+    "json_dumps",
+    "json_loads",
 ]
@@ -0,0 +1,45 @@
+"""
+JSON Utilities
+
+This module provides the JSON serialization helpers used for manifests and
+transcript outputs. It is backed by orjson, which serializes straight to
+UTF-8 bytes in C and is several times faster than the stdlib json module on
+large manifests.
+"""
+
+from typing import Any, Union
+
+import orjson
+
+
+def json_dumps(obj: Any, indent: bool = True) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+    
+    Non-ASCII characters are emitted as-is (the equivalent of
+    ``ensure_ascii=False``) and non-string dict keys are stringified.
+    
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+        
+    Returns:
+        JSON document as bytes
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, option=option)
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON document as bytes or string
+        
+    Returns:
+        Parsed object
+    """
+    return orjson.loads(data)
@@ -9,10 +9,13 @@ Author: [Your Name]
 Date: [Current Date]
 """
 
+import concurrent.futures
+import functools
 import os
+import stat
 import sys
 from pathlib import Path
-from typing import Union, Optional
+from typing import List, Optional, Tuple, Union
 
 
 def resolve_path(path_input: Union[str, Path], base_dir: Optional[Path] = None) -> Path:
@@ -70,12 +73,14 @@ def ensure_directory(directory_path: Union[str, Path]) -> Path:
     return directory_path
 
 
+@functools.cache
 def get_script_directory() -> Path:
     """
     Get the directory containing the main script.
     
     This function handles both regular Python execution and PyInstaller
-    frozen applications correctly.
+    frozen applications correctly. The result is cached, since it only
+    depends on where the package itself lives.
     
     Returns:
         Path object pointing to the script directory
@@ -127,16 +132,14 @@ def is_safe_path(base_path: Union[str, Path],
     Returns:
         True if the path is safe, False otherwise
     """
-    try:
-        base_path = Path(base_path).resolve()
-        target_path = Path(target_path).resolve()
-        
-        # Check if target is within base
-        target_path.relative_to(base_path)
-        return True
-        
-    except ValueError:
-        return False
+    # Compare resolved strings: no Path objects, and no ValueError raised
+    # (and caught) for every path outside the base
+    base = os.path.normcase(os.path.realpath(base_path))
+    target = os.path.normcase(os.path.realpath(target_path))
+    
+    # Check if target is within base; the separator keeps /a from matching /ab
+    prefix = base if base.endswith(os.sep) else base + os.sep
+    return target == base or target.startswith(prefix)
 
 
 def get_file_size(path: Union[str, Path]) -> int:
@@ -155,21 +158,55 @@ def get_file_size(path: Union[str, Path]) -> int:
     """
     path = Path(path)
     
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
+    # One stat() answers existence, type and size
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        # A file used as a parent directory is reported as ENOTDIR
+        raise FileNotFoundError(f"File not found: {path}") from None
     
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise OSError(f"Path is not a file: {path}")
     
-    return path.stat().st_size
+    return st.st_size
+
+
+def _scan_directory(path: str) -> Tuple[int, List[str]]:
+    """Sum the file sizes directly inside one directory and list its subdirectories.
+    
+    Uses os.scandir: entries carry their file type from the directory listing,
+    so no Path objects are built and directories need no stat(). Like rglob(),
+    symlinked directories are not descended into, while symlinked files count
+    with their target's size. Unreadable entries are skipped.
+    """
+    size = 0
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        size += entry.stat().st_size
+                except OSError:
+                    # Skip files that can't be accessed
+                    continue
+    except OSError:
+        # Skip directories that can't be listed
+        pass
+    return size, subdirs
 
 
-def get_directory_size(directory: Union[str, Path]) -> int:
+def get_directory_size(directory: Union[str, Path], max_workers: Optional[int] = None) -> int:
     """
     Get the total size of a directory in bytes.
     
     Args:
         directory: Path to the directory
+        max_workers: Scan up to this many directories concurrently. Worth it on
+            high-latency storage (NFS, FUSE mounts), where each stat() is a
+            round trip; local disks are fastest with the default single thread.
         
     Returns:
         Total size in bytes
@@ -188,13 +225,26 @@ def get_directory_size(directory: Union[str, Path]) -> int:
     
     total_size = 0
     
-    for file_path in directory.rglob('*'):
-        if file_path.is_file():
-            try:
-                total_size += file_path.stat().st_size
-            except OSError:
-                # Skip files that can't be accessed
-                continue
+    if not max_workers or max_workers <= 1:
+        stack = [os.fspath(directory)]
+        while stack:
+            size, subdirs = _scan_directory(stack.pop())
+            total_size += size
+            stack.extend(subdirs)
+        return total_size
+    
+    # Every discovered subdirectory becomes its own task; symlinked
+    # directories are never followed, so the walk cannot loop.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
+        pending = {ex.submit(_scan_directory, os.fspath(directory))}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                size, subdirs = future.result()
+                total_size += size
+                pending.update(ex.submit(_scan_directory, d) for d in subdirs)
     
     return total_size
 
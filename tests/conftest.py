@@ -7,6 +7,7 @@ used across all test modules.
 
 import pytest
 import json
+import subprocess
 from pathlib import Path
 from typing import Dict, Any
 
@@ -18,6 +19,33 @@ from src.transcribe_pipeline.dependencies.mocks import (
     MockEnvironmentProvider,
 )
 from src.transcribe_pipeline.config.pipeline_config import create_default_config
+from src.transcribe_pipeline.logging_utils import logging_config
+
+
+# FFprobe stdout for sample.mp3, encoded once for the whole session
+_FFPROBE_OK_BYTES = json.dumps({
+    "format": {
+        "duration": "120.5",
+        "bit_rate": "128000",
+        "format_name": "mp3",
+        "size": "1920000"
+    },
+    "streams": [
+        {
+            "codec_type": "audio",
+            "sample_rate": "44100",
+            "channels": 2
+        }
+    ]
+}).encode('utf-8')
+
+
+@pytest.fixture(autouse=True)
+def _reset_loggers():
+    """Unconfigure loggers a test created, keeping the modules' import-time ones."""
+    configured = set(logging_config._LOGGERS)
+    yield
+    logging_config._reset_for_tests(keep=configured)
 
 
 @pytest.fixture
@@ -158,30 +186,15 @@ def sample_chunk_file(temp_dir):
     return chunk_file
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ffprobe_output():
     """Provide mock FFprobe JSON output for testing."""
-    return json.dumps({
-        "format": {
-            "duration": "120.5",
-            "bit_rate": "128000",
-            "format_name": "mp3",
-            "size": "1920000"
-        },
-        "streams": [
-            {
-                "codec_type": "audio",
-                "sample_rate": "44100",
-                "channels": 2
-            }
-        ]
-    }).encode('utf-8')
+    return _FFPROBE_OK_BYTES  # immutable, safe to share
 
 
 @pytest.fixture
 def mock_ffprobe_success_result(mock_ffprobe_output):
     """Provide a mock successful FFprobe result."""
-    import subprocess
     return subprocess.CompletedProcess(
         args=["ffprobe", "test.mp3"],
         returncode=0,
@@ -193,7 +206,6 @@ def mock_ffprobe_success_result(mock_ffprobe_output):
 @pytest.fixture
 def mock_ffmpeg_success_result():
     """Provide a mock successful FFmpeg result."""
-    import subprocess
     return subprocess.CompletedProcess(
         args=["ffmpeg", "test.mp3"],
         returncode=0,
@@ -5,7 +5,9 @@ Tests configuration validation, CLI overrides, and edge cases.
 """
 
 import pytest
+import json
 from pathlib import Path
+from types import SimpleNamespace
 
 from src.transcribe_pipeline.config.pipeline_config import (
     PipelineConfig,
@@ -44,39 +46,24 @@ class TestModelConfig:
         )
         config.validate()  # Should not raise
     
-    def test_invalid_model(self):
-        """Test invalid model validation."""
-        config = ModelConfig(model="invalid-model")
-        with pytest.raises(ValueError, match="Invalid model"):
-            config.validate()
-    
-    def test_invalid_response_format(self):
-        """Test invalid response format validation."""
-        config = ModelConfig(response_format="invalid")
-        with pytest.raises(ValueError, match="Invalid response_format"):
-            config.validate()
+    def test_backoff_schedule(self):
+        """Test the per-attempt exponential backoff caps."""
+        config = ModelConfig(max_retries=3, backoff_base_ms=100)
+        assert config.backoff_schedule == (0.1, 0.2, 0.4)
+        assert ModelConfig(max_retries=0).backoff_schedule == ()
     
-    def test_invalid_parallel_requests(self):
-        """Test invalid parallel requests validation."""
-        config = ModelConfig(parallel_requests=0)
-        with pytest.raises(ValueError, match="parallel_requests must be between 1 and 10"):
-            config.validate()
-        
-        config = ModelConfig(parallel_requests=11)
-        with pytest.raises(ValueError, match="parallel_requests must be between 1 and 10"):
-            config.validate()
-    
-    def test_invalid_max_retries(self):
-        """Test invalid max retries validation."""
-        config = ModelConfig(max_retries=-1)
-        with pytest.raises(ValueError, match="max_retries must be between 0 and 10"):
-            config.validate()
-    
-    def test_invalid_backoff_base_ms(self):
-        """Test invalid backoff base ms validation."""
-        config = ModelConfig(backoff_base_ms=50)
-        with pytest.raises(ValueError, match="backoff_base_ms must be between 100 and 5000"):
-            config.validate()
+    @pytest.mark.parametrize("kwargs,msg", [
+        ({"model": "invalid-model"}, "Invalid model"),
+        ({"response_format": "invalid"}, "Invalid response_format"),
+        ({"parallel_requests": 0}, "parallel_requests must be between 1 and 10"),
+        ({"parallel_requests": 11}, "parallel_requests must be between 1 and 10"),
+        ({"max_retries": -1}, "max_retries must be between 0 and 10"),
+        ({"backoff_base_ms": 50}, "backoff_base_ms must be between 100 and 5000"),
+    ])
+    def test_invalid_model_field(self, kwargs, msg):
+        """Test that each out-of-range model field fails validation."""
+        with pytest.raises(ValueError, match=msg):
+            ModelConfig(**kwargs).validate()
 
 
 class TestChunkingConfig:
@@ -100,29 +87,16 @@ class TestChunkingConfig:
         )
         config.validate()  # Should not raise
     
-    def test_invalid_max_file_mb(self):
-        """Test invalid max file mb validation."""
-        config = ChunkingConfig(max_file_mb=0)
-        with pytest.raises(ValueError, match="max_file_mb must be between 1 and 100"):
-            config.validate()
-    
-    def test_invalid_target_chunk_mb(self):
-        """Test invalid target chunk mb validation."""
-        config = ChunkingConfig(target_chunk_mb=30, max_file_mb=25)
-        with pytest.raises(ValueError, match="target_chunk_mb must be between 1 and 25"):
-            config.validate()
-    
-    def test_invalid_max_chunk_secs(self):
-        """Test invalid max chunk secs validation."""
-        config = ChunkingConfig(max_chunk_secs=30)
-        with pytest.raises(ValueError, match="max_chunk_secs must be between 60 and 3600"):
-            config.validate()
-    
-    def test_invalid_overlap_secs(self):
-        """Test invalid overlap secs validation."""
-        config = ChunkingConfig(overlap_secs=35.0)
-        with pytest.raises(ValueError, match="overlap_secs must be between 0 and 30"):
-            config.validate()
+    @pytest.mark.parametrize("kwargs,msg", [
+        ({"max_file_mb": 0}, "max_file_mb must be between 1 and 100"),
+        ({"target_chunk_mb": 30, "max_file_mb": 25}, "target_chunk_mb must be between 1 and 25"),
+        ({"max_chunk_secs": 30}, "max_chunk_secs must be between 60 and 3600"),
+        ({"overlap_secs": 35.0}, "overlap_secs must be between 0 and 30"),
+    ])
+    def test_invalid_chunking_field(self, kwargs, msg):
+        """Test that each out-of-range chunking field fails validation."""
+        with pytest.raises(ValueError, match=msg):
+            ChunkingConfig(**kwargs).validate()
 
 
 class TestReencodeConfig:
@@ -147,29 +121,16 @@ class TestReencodeConfig:
         )
         config.validate()  # Should not raise
     
-    def test_invalid_codec(self):
-        """Test invalid codec validation."""
-        config = ReencodeConfig(codec="invalid")
-        with pytest.raises(ValueError, match="Invalid codec"):
-            config.validate()
-    
-    def test_invalid_bitrate(self):
-        """Test invalid bitrate validation."""
-        config = ReencodeConfig(bitrate_kbps=20)
-        with pytest.raises(ValueError, match="bitrate_kbps must be between 32 and 320"):
-            config.validate()
-    
-    def test_invalid_channels(self):
-        """Test invalid channels validation."""
-        config = ReencodeConfig(channels=3)
-        with pytest.raises(ValueError, match="channels must be 1 or 2"):
-            config.validate()
-    
-    def test_invalid_sample_rate(self):
-        """Test invalid sample rate validation."""
-        config = ReencodeConfig(sample_rate=11025)
-        with pytest.raises(ValueError, match="Invalid sample_rate"):
-            config.validate()
+    @pytest.mark.parametrize("kwargs,msg", [
+        ({"codec": "invalid"}, "Invalid codec"),
+        ({"bitrate_kbps": 20}, "bitrate_kbps must be between 32 and 320"),
+        ({"channels": 3}, "channels must be 1 or 2"),
+        ({"sample_rate": 11025}, "Invalid sample_rate"),
+    ])
+    def test_invalid_reencode_field(self, kwargs, msg):
+        """Test that each out-of-range re-encoding field fails validation."""
+        with pytest.raises(ValueError, match=msg):
+            ReencodeConfig(**kwargs).validate()
 
 
 class TestPipelineConfig:
@@ -191,6 +152,16 @@ class TestPipelineConfig:
         config = create_default_config()
         config.validate()  # Should not raise
     
+    def test_config_uses_slots(self):
+        """Test that configuration objects reject unknown attributes."""
+        config = create_default_config()
+        
+        for obj in (config, config.model, config.chunking, config.reencode,
+                    config.silence, config.outputs, config.paths):
+            assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            config.model.modle = "gpt-4o-transcribe"  # typo must not pass silently
+    
     def test_invalid_segmenter(self):
         """Test invalid segmenter validation."""
         config = create_default_config()
@@ -214,14 +185,12 @@ class TestPipelineConfig:
         """Test CLI argument override application."""
         config = create_default_config()
         
-        # Create mock args object
-        class MockArgs:
-            model = "gpt-4o-mini-transcribe"
-            segmenter = "silence"
-            prompt = "Test prompt"
-            work_dir = "/test/workdir"
-        
-        args = MockArgs()
+        args = SimpleNamespace(
+            model="gpt-4o-mini-transcribe",
+            segmenter="silence",
+            prompt="Test prompt",
+            work_dir="/test/workdir",
+        )
         config.apply_cli_overrides(args)
         
         assert config.model.model == "gpt-4o-mini-transcribe"
@@ -229,11 +198,21 @@ class TestPipelineConfig:
         assert config.model.prompt == "Test prompt"
         assert config.paths.work_dir == "/test/workdir"
     
+    def test_apply_cli_overrides_without_overrides(self):
+        """Test that empty CLI arguments leave the configuration untouched."""
+        config = create_default_config()
+        before = config.to_dict()
+        
+        args = SimpleNamespace(model=None, prompt=None)
+        config.apply_cli_overrides(args)  # segmenter/work_dir missing entirely
+        
+        assert config.to_dict() == before
+    
     def test_get_input_audio_path_with_cli(self, temp_dir):
         """Test getting input audio path from CLI argument."""
         config = create_default_config()
         test_file = temp_dir / "test.mp3"
-        test_file.write_bytes(b"dummy content")
+        test_file.touch()  # only existence is checked
         
         input_path = config.get_input_audio_path(str(test_file))
         
@@ -243,7 +222,7 @@ class TestPipelineConfig:
         """Test getting input audio path from config."""
         config = create_default_config()
         test_file = temp_dir / "config.mp3"
-        test_file.write_bytes(b"dummy content")
+        test_file.touch()  # only existence is checked
         config.paths.input_audio = str(test_file)
         
         input_path = config.get_input_audio_path()
@@ -262,6 +241,17 @@ class TestPipelineConfig:
         work_dir = config.get_work_directory("/custom/workdir")
         
         assert work_dir == Path("/custom/workdir").expanduser().resolve()
+    
+    def test_save_effective_config(self, temp_dir):
+        """Test that the effective configuration is written as UTF-8 JSON."""
+        config = create_default_config()
+        config.model.prompt = "Réunion — ordre du jour"
+        
+        config.save_effective_config(temp_dir)
+        
+        config_file = temp_dir / "effective_config.json"
+        assert json.loads(config_file.read_text(encoding="utf-8")) == config.to_dict()
+        assert "Réunion" in config_file.read_text(encoding="utf-8")  # not \u-escaped
 
 
 class TestCreateConfigFromDict:
@@ -310,6 +300,20 @@ class TestCreateConfigFromDict:
         assert config.outputs.write_json is False
         assert config.outputs.write_srt is True
     
+    def test_create_from_dict_round_trip(self):
+        """Test that every key written by to_dict() is read back."""
+        original = PipelineConfig()
+        original.model.prompt = "Meeting notes"
+        original.chunking.overlap_secs = 0.0
+        original.silence.min_silence_dur = 1.5
+        original.outputs.write_vtt = True
+        original.paths.work_dir = "custom_outputs"
+        original.segmenter = "silence"
+        
+        config = create_config_from_dict(original.to_dict())
+        
+        assert config.to_dict() == original.to_dict()
+    
     def test_create_from_dict_validation(self):
         """Test that invalid dictionary values are caught during validation."""
         config_dict = {
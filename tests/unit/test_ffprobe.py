@@ -5,10 +5,58 @@ Tests audio metadata extraction with mocked subprocess operations.
 """
 
 import pytest
+import json
 import subprocess
 from pathlib import Path
 
-from src.transcribe_pipeline.audio_utils.ffprobe import probe_audio
+from src.transcribe_pipeline.audio_utils import ffprobe
+from src.transcribe_pipeline.audio_utils.ffprobe import SHOW_ENTRIES, _probe_cached, probe_audio
+
+
+def _make_ok(payload: dict) -> subprocess.CompletedProcess:
+    """Build a successful FFprobe result printing the given JSON payload."""
+    return subprocess.CompletedProcess(
+        args=["ffprobe", "test.mp3"],
+        returncode=0,
+        stdout=json.dumps(payload).encode('utf-8'),
+        stderr=b""
+    )
+
+
+_PARSING_CASES = [
+    pytest.param(
+        {
+            "format": {"bit_rate": "128000", "format_name": "mp3", "size": "1920000"},
+            "streams": [{"codec_type": "audio", "sample_rate": "44100", "channels": 2}],
+        },
+        {"duration": 0.0, "bit_rate": 128000},
+        id="missing_duration",
+    ),
+    pytest.param(
+        {
+            "format": {"duration": "120.5", "bit_rate": "128000", "format_name": "mp3", "size": "1920000"},
+            "streams": [{"codec_type": "video", "width": 1920, "height": 1080}],
+        },
+        {"duration": 120.5, "bit_rate": 128000, "sample_rate": 44100, "channels": 2},  # defaults
+        id="missing_audio_stream",
+    ),
+    pytest.param(
+        {
+            "format": {"duration": "120.5", "bit_rate": "128000", "format_name": "mp3", "size": "1920000"},
+            "streams": [{"codec_type": "audio", "codec_name": "mp3", "sample_rate": "44100", "channels": "2"}],
+        },
+        {"duration": 120.5, "bit_rate": 128000, "sample_rate": 44100, "channels": 2, "size_bytes": 1920000,
+         "codec_name": "mp3"},
+        id="string_numbers",
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def _clear_probe_cache():
+    """Keep cached probe results from leaking between tests."""
+    yield
+    _probe_cached.cache_clear()
 
 
 class TestProbeAudio:
@@ -18,7 +66,7 @@ class TestProbeAudio:
         """Test successful audio probing with mock subprocess."""
         # Setup mock subprocess to return successful FFprobe result
         mock_subprocess_provider.set_result(
-            ["ffprobe", "-v", "error", "-print_format", "json", "-show_format", "-show_streams", str(sample_audio_file)],
+            ["ffprobe", "-v", "error", "-print_format", "json", "-show_entries", SHOW_ENTRIES, str(sample_audio_file)],
             mock_ffprobe_success_result
         )
         
@@ -65,7 +113,7 @@ class TestProbeAudio:
         )
         
         mock_subprocess_provider.set_result(
-            ["ffprobe", "-v", "error", "-print_format", "json", "-show_format", "-show_streams", str(sample_audio_file)],
+            ["ffprobe", "-v", "error", "-print_format", "json", "-show_entries", SHOW_ENTRIES, str(sample_audio_file)],
             error_result
         )
         
@@ -73,85 +121,6 @@ class TestProbeAudio:
         with pytest.raises(RuntimeError, match="FFprobe error"):
             probe_audio(sample_audio_file, mock_subprocess_provider)
     
-    def test_probe_audio_missing_duration(self, mock_subprocess_provider, sample_audio_file):
-        """Test handling of audio files with missing duration information."""
-        import json
-        
-        # Create FFprobe output without duration
-        ffprobe_output = json.dumps({
-            "format": {
-                "bit_rate": "128000",
-                "format_name": "mp3",
-                "size": "1920000"
-            },
-            "streams": [
-                {
-                    "codec_type": "audio",
-                    "sample_rate": "44100",
-                    "channels": 2
-                }
-            ]
-        }).encode('utf-8')
-        
-        success_result = subprocess.CompletedProcess(
-            args=["ffprobe", "test.mp3"],
-            returncode=0,
-            stdout=ffprobe_output,
-            stderr=b""
-        )
-        
-        mock_subprocess_provider.set_result(
-            ["ffprobe", "-v", "error", "-print_format", "json", "-show_format", "-show_streams", str(sample_audio_file)],
-            success_result
-        )
-        
-        result = probe_audio(sample_audio_file, mock_subprocess_provider)
-        
-        # Should handle missing duration gracefully
-        assert result["duration"] == 0.0
-        assert result["bit_rate"] == 128000
-    
-    def test_probe_audio_missing_audio_stream(self, mock_subprocess_provider, sample_audio_file):
-        """Test handling of files without audio streams."""
-        import json
-        
-        # Create FFprobe output without audio stream
-        ffprobe_output = json.dumps({
-            "format": {
-                "duration": "120.5",
-                "bit_rate": "128000",
-                "format_name": "mp3",
-                "size": "1920000"
-            },
-            "streams": [
-                {
-                    "codec_type": "video",
-                    "width": 1920,
-                    "height": 1080
-                }
-            ]
-        }).encode('utf-8')
-        
-        success_result = subprocess.CompletedProcess(
-            args=["ffprobe", "test.mp3"],
-            returncode=0,
-            stdout=ffprobe_output,
-            stderr=b""
-        )
-        
-        mock_subprocess_provider.set_result(
-            ["ffprobe", "-v", "error", "-print_format", "json", "-show_format", "-show_streams", str(sample_audio_file)],
-            success_result
-        )
-        
-        result = probe_audio(sample_audio_file, mock_subprocess_provider)
-        
-        # Should use default values for missing audio stream info
-        assert result["duration"] == 120.5
-        assert result["bit_rate"] == 128000
-        assert result["sample_rate"] == 44100  # Default
-        assert result["channels"] == 2  # Default
-    
     def test_probe_audio_command_construction(self, mock_subprocess_provider, sample_audio_file, mock_ffprobe_success_result):
         """Test that the correct FFprobe command is constructed."""
         # Setup mock result for the specific command
@@ -159,8 +128,7 @@ class TestProbeAudio:
             "ffprobe",
             "-v", "error",
             "-print_format", "json",
-            "-show_format",
-            "-show_streams",
+            "-show_entries", SHOW_ENTRIES,
             str(sample_audio_file)
         ]
         mock_subprocess_provider.set_result(expected_cmd, mock_ffprobe_success_result)
@@ -180,44 +148,52 @@ class TestProbeAudio:
         assert kwargs["stderr"] == subprocess.PIPE
         assert kwargs["check"] is False
     
-    def test_probe_audio_result_parsing_edge_cases(self, mock_subprocess_provider, sample_audio_file):
-        """Test parsing of edge case FFprobe outputs."""
-        import json
-        
-        # Test with string values that need conversion
-        ffprobe_output = json.dumps({
-            "format": {
-                "duration": "120.5",
-                "bit_rate": "128000",
-                "format_name": "mp3",
-                "size": "1920000"
-            },
-            "streams": [
-                {
-                    "codec_type": "audio",
-                    "sample_rate": "44100",
-                    "channels": "2"
-                }
-            ]
-        }).encode('utf-8')
-        
-        success_result = subprocess.CompletedProcess(
-            args=["ffprobe", "test.mp3"],
-            returncode=0,
-            stdout=ffprobe_output,
-            stderr=b""
+    @pytest.mark.parametrize("payload,expected", _PARSING_CASES)
+    def test_probe_audio_result_parsing(self, mock_subprocess_provider, sample_audio_file, payload, expected):
+        """Test defaults and type conversions for partial or string-typed FFprobe output."""
+        mock_subprocess_provider.set_result(
+            ["ffprobe", "-v", "error", "-print_format", "json", "-show_entries", SHOW_ENTRIES, str(sample_audio_file)],
+            _make_ok(payload)
+        )
+        
+        result = probe_audio(sample_audio_file, mock_subprocess_provider)
+        
+        for key, value in expected.items():
+            assert result[key] == value
+            assert type(result[key]) is type(value)
+    
+    def test_probe_audio_caches_unchanged_file(self, mock_subprocess_provider, sample_audio_file,
+                                               mock_ffprobe_success_result, monkeypatch):
+        """Test that an unchanged file is probed once and a rewritten one again."""
+        monkeypatch.setattr(ffprobe, "_DEFAULT_PROVIDER", mock_subprocess_provider)
+        mock_subprocess_provider.set_result(
+            ["ffprobe", "-v", "error", "-print_format", "json", "-show_entries", SHOW_ENTRIES,
+             str(sample_audio_file.resolve())],
+            mock_ffprobe_success_result
         )
         
+        first = probe_audio(sample_audio_file)
+        first["duration"] = 0.0  # callers get their own copy
+        second = probe_audio(sample_audio_file)
+        
+        assert len(mock_subprocess_provider.commands_run) == 1
+        assert second["duration"] == 120.5
+        
+        sample_audio_file.write_bytes(b"different audio content")
+        probe_audio(sample_audio_file)
+        
+        assert len(mock_subprocess_provider.commands_run) == 2
+    
+    def test_probe_audio_injected_provider_is_not_cached(self, mock_subprocess_provider, sample_audio_file,
+                                                         mock_ffprobe_success_result):
+        """Test that an injected provider always runs FFprobe and is never held by the cache."""
         mock_subprocess_provider.set_result(
-            ["ffprobe", "-v", "error", "-print_format", "json", "-show_format", "-show_streams", str(sample_audio_file)],
-            success_result
+            ["ffprobe", "-v", "error", "-print_format", "json", "-show_entries", SHOW_ENTRIES, str(sample_audio_file)],
+            mock_ffprobe_success_result
         )
         
-        result = probe_audio(sample_audio_file, mock_subprocess_provider)
+        probe_audio(sample_audio_file, mock_subprocess_provider)
+        probe_audio(sample_audio_file, mock_subprocess_provider)
         
-        # Verify type conversions
-        assert isinstance(result["duration"], float)
-        assert isinstance(result["bit_rate"], int)
-        assert isinstance(result["sample_rate"], int)
-        assert isinstance(result["channels"], int)
-        assert isinstance(result["size_bytes"], int)
+        assert len(mock_subprocess_provider.commands_run) == 2
+        assert _probe_cached.cache_info().currsize == 0
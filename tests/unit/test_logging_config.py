@@ -0,0 +1,173 @@
+"""
+Unit tests for the logging configuration module.
+
+Tests logger creation and record formatting.
+"""
+
+import pytest
+import logging
+import logging.handlers
+
+from src.transcribe_pipeline.logging_utils.logging_config import (
+    DEFAULT_DATE_FORMAT,
+    DEFAULT_LOG_FORMAT,
+    LOGGING_CONFIG,
+    LoggerSpec,
+    _LISTENER_STARTED,
+    _LOGGERS,
+    _OUTPUTS,
+    _drain_listener,
+    _reset_for_tests,
+    _CachedTimeFormatter,
+    _output_handlers,
+    disable_file_logging,
+    get_logger,
+    set_console_level,
+)
+
+
+@pytest.fixture
+def file_logger(temp_dir, monkeypatch, request):
+    """Provide a fresh file-only logger writing into the temp directory."""
+    name = f"queue_test.{request.node.name}"
+    monkeypatch.setitem(LOGGING_CONFIG, name, LoggerSpec(
+        level="DEBUG",
+        log_filename="queue_test.log",
+        console_output=False,
+        file_output=True,
+    ))
+    return get_logger(name, log_dir=temp_dir)
+
+
+def _flush(logger: logging.Logger) -> None:
+    """Wait until the shared listener has handled every queued record."""
+    _drain_listener()
+
+
+def _record(created: float) -> logging.LogRecord:
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "message", None, None)
+    record.created = created
+    record.msecs = (created - int(created)) * 1000
+    return record
+
+
+class TestCachedTimeFormatter:
+    """Test timestamp caching in the log formatter."""
+    
+    def test_matches_standard_formatter(self):
+        """Test that cached timestamps equal the stdlib rendering."""
+        cached = _CachedTimeFormatter(fmt=DEFAULT_LOG_FORMAT, datefmt=DEFAULT_DATE_FORMAT)
+        plain = logging.Formatter(fmt=DEFAULT_LOG_FORMAT, datefmt=DEFAULT_DATE_FORMAT)
+        
+        for created in (1700000000.1, 1700000000.9, 1700000001.0, 1700000061.5):
+            record = _record(created)
+            assert cached.formatTime(record, DEFAULT_DATE_FORMAT) == plain.formatTime(record, DEFAULT_DATE_FORMAT)
+    
+    def test_without_datefmt_keeps_milliseconds(self):
+        """Test that the default (millisecond) rendering is not cached per second."""
+        formatter = _CachedTimeFormatter()
+        
+        first = formatter.formatTime(_record(1700000000.100))
+        second = formatter.formatTime(_record(1700000000.900))
+        
+        assert first != second
+
+
+class TestGetLogger:
+    """Test logger setup with background handlers."""
+    
+    def test_records_are_written_by_listener(self, file_logger, temp_dir):
+        """Test that the logger only enqueues and the listener writes the file."""
+        assert any(isinstance(h, logging.handlers.QueueHandler) for h in file_logger.handlers)
+        assert not any(isinstance(h, logging.FileHandler) for h in file_logger.handlers)
+        
+        file_logger.info("hello from the queue")
+        _flush(file_logger)
+        for handler in _output_handlers(file_logger):
+            handler.flush()
+        
+        assert "hello from the queue" in (temp_dir / "queue_test.log").read_text(encoding="utf-8")
+    
+    def test_listener_starts_on_first_record(self, file_logger):
+        """Test that creating a logger starts no thread until something is logged."""
+        _drain_listener()
+        get_logger(f"{file_logger.name}.idle")
+        assert not _LISTENER_STARTED.is_set()
+        
+        file_logger.info("first record")
+        assert _LISTENER_STARTED.is_set()
+    
+    def test_disable_file_logging(self, file_logger, temp_dir):
+        """Test that file handlers are detached from the listener."""
+        file_logger.info("before")
+        
+        disable_file_logging(file_logger)
+        file_logger.info("after")
+        _flush(file_logger)
+        
+        content = (temp_dir / "queue_test.log").read_text(encoding="utf-8")
+        assert "before" in content
+        assert "after" not in content
+        assert _output_handlers(file_logger) == ()
+        assert not file_logger.isEnabledFor(logging.CRITICAL)  # nothing left to write to
+    
+    def test_disable_file_logging_raises_logger_level(self, temp_dir, monkeypatch, request):
+        """Test that the logger level follows the console once the file is gone."""
+        name = f"level_test.{request.node.name}"
+        monkeypatch.setitem(LOGGING_CONFIG, name, LoggerSpec(
+            level="DEBUG", console_output=True, file_output=True,
+        ))
+        logger = get_logger(name, log_dir=temp_dir, console_level="WARNING")
+        assert logger.isEnabledFor(logging.DEBUG)  # file accepts DEBUG
+        
+        disable_file_logging(logger)
+        
+        assert not logger.isEnabledFor(logging.INFO)
+        assert logger.isEnabledFor(logging.WARNING)
+    
+    def test_file_writes_are_buffered_until_warning(self, file_logger, temp_dir):
+        """Test that info records are batched and a warning flushes them."""
+        log_file = temp_dir / "queue_test.log"
+        
+        file_logger.info("buffered line")
+        _flush(file_logger)
+        assert "buffered line" not in log_file.read_text(encoding="utf-8")
+        
+        file_logger.warning("flush now")
+        _flush(file_logger)
+        content = log_file.read_text(encoding="utf-8")
+        assert content.index("buffered line") < content.index("flush now")
+    
+    def test_logger_level_follows_handler_levels(self, monkeypatch, request):
+        """Test that disabled levels are rejected by the logger itself."""
+        name = f"level_test.{request.node.name}"
+        monkeypatch.setitem(LOGGING_CONFIG, name, LoggerSpec(
+            level="INFO", console_output=True, file_output=False,
+        ))
+        logger = get_logger(name)
+        assert not logger.isEnabledFor(logging.DEBUG)
+        assert logger.isEnabledFor(logging.INFO)
+        
+        set_console_level(logger, "DEBUG")
+        assert logger.isEnabledFor(logging.DEBUG)
+    
+    def test_level_names_are_case_insensitive(self, monkeypatch, request):
+        """Test that lower-case level names resolve like upper-case ones."""
+        name = f"level_test.{request.node.name}"
+        monkeypatch.setitem(LOGGING_CONFIG, name, LoggerSpec(file_output=False))
+        logger = get_logger(name, console_level="warning")
+        assert _output_handlers(logger)[0].level == logging.WARNING
+        
+        set_console_level(logger, "debug")
+        assert _output_handlers(logger)[0].level == logging.DEBUG
+    
+    def test_reset_for_tests_unconfigures_logger(self, file_logger):
+        """Test that the test-reset hook drops cached loggers and closes their files."""
+        assert get_logger(file_logger.name) is file_logger  # cached fast path
+        file_handler = _output_handlers(file_logger)[0].target
+        
+        _reset_for_tests(keep=set(_LOGGERS) - {file_logger.name})
+        
+        assert file_logger.name not in _OUTPUTS
+        assert file_logger.handlers == []
+        assert file_handler.stream is None  # log file closed
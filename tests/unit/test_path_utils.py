@@ -0,0 +1,145 @@
+"""
+Unit tests for the path utilities module.
+
+Tests directory walking and filename helpers against a temporary directory.
+"""
+
+import pytest
+
+from src.transcribe_pipeline.utils.path_utils import (
+    get_directory_size,
+    get_file_size,
+    is_safe_path,
+    sanitize_filename,
+)
+
+
+class TestGetFileSize:
+    """Test single-file size lookup."""
+
+    def test_get_file_size(self, temp_dir):
+        """Test the size of a regular file."""
+        file_path = temp_dir / "chunk_0000.m4a"
+        file_path.write_bytes(b"x" * 1234)
+
+        assert get_file_size(file_path) == 1234
+
+    def test_get_file_size_missing(self, temp_dir):
+        """Test error when the file does not exist."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            get_file_size(temp_dir / "missing.m4a")
+
+    def test_get_file_size_parent_is_file(self, temp_dir):
+        """Test that a path through a regular file reports file-not-found."""
+        parent = temp_dir / "audio.m4a"
+        parent.write_bytes(b"x")
+
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            get_file_size(parent / "chunk_0000.m4a")
+
+    def test_get_file_size_directory(self, temp_dir):
+        """Test error when the path is a directory."""
+        with pytest.raises(OSError, match="not a file"):
+            get_file_size(temp_dir)
+
+
+class TestGetDirectorySize:
+    """Test directory size calculation."""
+
+    def test_get_directory_size_nested(self, temp_dir):
+        """Test that files in nested directories are all counted."""
+        (temp_dir / "a" / "b").mkdir(parents=True)
+        (temp_dir / "top.bin").write_bytes(b"x" * 10)
+        (temp_dir / "a" / "mid.bin").write_bytes(b"x" * 200)
+        (temp_dir / "a" / "b" / "deep.bin").write_bytes(b"x" * 3000)
+
+        assert get_directory_size(temp_dir) == 3210
+
+    def test_get_directory_size_matches_rglob(self, temp_dir):
+        """Test the walk agrees with rglob() on symlinked files and directories."""
+        (temp_dir / "data").mkdir()
+        (temp_dir / "data" / "audio.mp3").write_bytes(b"x" * 500)
+        try:
+            (temp_dir / "link.mp3").symlink_to(temp_dir / "data" / "audio.mp3")
+            (temp_dir / "link_dir").symlink_to(temp_dir / "data", target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported here")
+
+        expected = sum(p.stat().st_size for p in temp_dir.rglob("*") if p.is_file())
+
+        assert get_directory_size(temp_dir) == expected == 1000
+
+    def test_get_directory_size_parallel_matches_sequential(self, temp_dir):
+        """Test that the threaded walk sums the same 100 files as the sequential one."""
+        for i in range(10):
+            sub = temp_dir / f"dir{i}" / "nested"
+            sub.mkdir(parents=True)
+            for j in range(10):
+                (sub / f"file{j}.bin").write_bytes(b"x" * (i * 10 + j))
+
+        sequential = get_directory_size(temp_dir)
+
+        assert get_directory_size(temp_dir, max_workers=4) == sequential == sum(range(100))
+
+    def test_get_directory_size_missing(self, temp_dir):
+        """Test error when the directory does not exist."""
+        with pytest.raises(FileNotFoundError, match="Directory not found"):
+            get_directory_size(temp_dir / "missing")
+
+    def test_get_directory_size_not_a_directory(self, temp_dir):
+        """Test error when the path is a file."""
+        file_path = temp_dir / "file.txt"
+        file_path.write_text("content", encoding="utf-8")
+
+        with pytest.raises(OSError, match="not a directory"):
+            get_directory_size(file_path)
+
+
+class TestIsSafePath:
+    """Test directory traversal checks."""
+
+    @pytest.mark.parametrize("target,expected", [
+        ("base", True),
+        ("base/chunks/chunk_0000.m4a", True),
+        ("base/chunks/../chunk_0000.m4a", True),
+        ("base/../outside.txt", False),
+        ("base_other/file.txt", False),  # shares the prefix, not the directory
+    ])
+    def test_is_safe_path(self, temp_dir, target, expected):
+        """Test paths inside, equal to, and outside the base directory."""
+        assert is_safe_path(temp_dir / "base", temp_dir / target) is expected
+
+    def test_is_safe_path_filesystem_root(self, temp_dir):
+        """Test that everything is inside the filesystem root."""
+        assert is_safe_path(temp_dir.anchor, temp_dir) is True
+
+    def test_is_safe_path_symlink_escape(self, temp_dir):
+        """Test that a symlink pointing out of the base is rejected."""
+        (temp_dir / "base").mkdir()
+        (temp_dir / "outside").mkdir()
+        try:
+            (temp_dir / "base" / "link").symlink_to(temp_dir / "outside", target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported here")
+
+        assert is_safe_path(temp_dir / "base", temp_dir / "base" / "link" / "file.txt") is False
+
+
+class TestSanitizeFilename:
+    """Test filename sanitizing."""
+
+    @pytest.mark.parametrize("filename,expected", [
+        ('My Recording: part 1/2 <final>?.mp3', "My Recording_ part 1_2 _final__.mp3"),
+        (' .hidden. ', "hidden"),
+        ("...", "unnamed_file"),
+        ("a" * 300 + ".mp3", "a" * 251 + ".mp3"),
+    ])
+    def test_sanitize_filename(self, filename, expected):
+        """Test replacement, stripping, empty fallback and truncation."""
+        assert sanitize_filename(filename) == expected
+
+    def test_sanitize_filename_safe_name_not_copied(self):
+        """Test that an already-safe name comes back as the same object."""
+        filename = "".join(["chunk_", "0001.m4a"])  # built at runtime, not interned
+
+        assert sanitize_filename(filename) is filename
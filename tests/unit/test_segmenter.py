@@ -0,0 +1,174 @@
+"""
+Unit tests for the segmenter module.
+
+Tests chunk planning and FFmpeg command construction with mocked dependencies.
+"""
+
+import pytest
+import json
+import subprocess
+from pathlib import Path
+
+from src.transcribe_pipeline.audio_utils.segmenter import plan_and_segment
+
+
+class TestPlanAndSegment:
+    """Test chunk planning and segmentation."""
+
+    def test_plan_and_segment_manifest(self, mock_subprocess_provider, mock_fs_provider,
+                                       sample_config, sample_audio_metadata, temp_dir):
+        """Test that chunks are planned in order with overlaps."""
+        manifest_path = temp_dir / "manifest.json"
+
+        plan_and_segment(
+            Path("/path/to/audio.mp3"), sample_audio_metadata, sample_config,
+            temp_dir, manifest_path, mock_subprocess_provider, mock_fs_provider
+        )
+
+        manifest = json.loads(mock_fs_provider.read_text(manifest_path))
+        chunks = manifest["chunks"]
+
+        # 120.5s of audio in 60s windows
+        assert [c["index"] for c in chunks] == [0, 1, 2]
+        assert chunks[0]["t_start"] == 0.0
+        assert chunks[0]["overlap_head"] == 0.0
+        assert chunks[1]["t_start"] == 59.0  # 1s overlap in test config
+        assert chunks[-1]["t_end"] == 120.5
+        assert chunks[-1]["overlap_tail"] == 0.0
+        assert all(c["status"] == "pending" for c in chunks)
+
+    def test_plan_and_segment_runs_one_ffmpeg_per_chunk(self, mock_subprocess_provider, mock_fs_provider,
+                                                        sample_config, sample_audio_metadata, temp_dir):
+        """Test that every planned chunk is cut by FFmpeg."""
+        manifest_path = temp_dir / "manifest.json"
+
+        plan_and_segment(
+            Path("/path/to/audio.mp3"), sample_audio_metadata, sample_config,
+            temp_dir, manifest_path, mock_subprocess_provider, mock_fs_provider
+        )
+
+        manifest = json.loads(mock_fs_provider.read_text(manifest_path))
+        outputs = sorted(cmd[-1] for cmd, _ in mock_subprocess_provider.commands_run)
+
+        assert outputs == [c["file"] for c in manifest["chunks"]]
+        
+        cmd, kwargs = mock_subprocess_provider.commands_run[0]
+        assert cmd[:2] == ["ffmpeg", "-y"]
+        assert cmd[cmd.index("-loglevel") + 1] == "error"
+        assert kwargs["stdout"] == subprocess.DEVNULL
+        assert kwargs["stderr"] == subprocess.PIPE
+
+    def test_plan_and_segment_ffmpeg_error(self, mock_subprocess_provider, mock_fs_provider,
+                                           sample_config, sample_audio_metadata, temp_dir):
+        """Test that FFmpeg failures are raised."""
+        mock_subprocess_provider.default_result = subprocess.CompletedProcess(
+            args=[], returncode=1, stdout=b"", stderr=b"ffmpeg failed"
+        )
+
+        with pytest.raises(RuntimeError, match="ffmpeg failed"):
+            plan_and_segment(
+                Path("/path/to/audio.mp3"), sample_audio_metadata, sample_config,
+                temp_dir, temp_dir / "manifest.json", mock_subprocess_provider, mock_fs_provider
+            )
+
+    def test_plan_and_segment_zero_duration(self, mock_subprocess_provider, mock_fs_provider,
+                                            sample_config, sample_audio_metadata, temp_dir):
+        """Test error when audio duration is unknown."""
+        sample_audio_metadata["duration"] = 0.0
+
+        with pytest.raises(ValueError, match="Could not determine audio duration"):
+            plan_and_segment(
+                Path("/path/to/audio.mp3"), sample_audio_metadata, sample_config,
+                temp_dir, temp_dir / "manifest.json", mock_subprocess_provider, mock_fs_provider
+            )
+
+    def test_plan_and_segment_single_pass_without_overlap(self, mock_subprocess_provider, mock_fs_provider,
+                                                          sample_config, sample_audio_metadata, temp_dir):
+        """Test that zero overlap uses one segment-muxer pass and its segment list."""
+        sample_config.chunking.overlap_secs = 0.0
+        manifest_path = temp_dir / "manifest.json"
+        mock_fs_provider.set_file_content(
+            temp_dir / "segments.csv",
+            "chunk_0000.m4a,0.000000,60.010000\n"
+            "chunk_0001.m4a,60.010000,120.500000\n"
+        )
+
+        plan_and_segment(
+            Path("/path/to/audio.mp3"), sample_audio_metadata, sample_config,
+            temp_dir, manifest_path, mock_subprocess_provider, mock_fs_provider
+        )
+
+        assert len(mock_subprocess_provider.commands_run) == 1
+        cmd, _ = mock_subprocess_provider.commands_run[0]
+        assert cmd[cmd.index("-f") + 1] == "segment"
+
+        chunks = json.loads(mock_fs_provider.read_text(manifest_path))["chunks"]
+        assert [c["file"] for c in chunks] == [
+            str(temp_dir / "chunk_0000.m4a"),
+            str(temp_dir / "chunk_0001.m4a"),
+        ]
+        assert chunks[1]["t_start"] == 60.01
+        assert chunks[1]["t_end"] == 120.5
+
+    def test_plan_and_segment_stream_copy(self, mock_subprocess_provider, mock_fs_provider,
+                                          sample_config, sample_audio_metadata, temp_dir):
+        """Test that disabled re-encoding copies streams into the source container."""
+        sample_config.reencode.enabled = False
+        manifest_path = temp_dir / "manifest.json"
+
+        plan_and_segment(
+            Path("/path/to/audio.mp3"), sample_audio_metadata, sample_config,
+            temp_dir, manifest_path, mock_subprocess_provider, mock_fs_provider
+        )
+
+        cmd, _ = mock_subprocess_provider.commands_run[0]
+        assert cmd.index("-ss") < cmd.index("-i")  # input seeking
+        assert cmd[cmd.index("-c:a") + 1] == "copy"
+
+        chunks = json.loads(mock_fs_provider.read_text(manifest_path))["chunks"]
+        assert all(c["file"].endswith(".mp3") for c in chunks)
+
+    def test_plan_and_segment_unmapped_container_reencodes(self, mock_subprocess_provider, mock_fs_provider,
+                                                           sample_config, sample_audio_metadata, temp_dir):
+        """Test that a container without a copy mapping is re-encoded to .m4a, not copied."""
+        sample_config.reencode.enabled = False
+        sample_audio_metadata["format_name"] = "matroska,webm"
+        manifest_path = temp_dir / "manifest.json"
+
+        plan_and_segment(
+            Path("/path/to/audio.mkv"), sample_audio_metadata, sample_config,
+            temp_dir, manifest_path, mock_subprocess_provider, mock_fs_provider
+        )
+
+        cmd, _ = mock_subprocess_provider.commands_run[0]
+        assert "copy" not in cmd  # ffmpeg's default AAC encoder for .m4a
+
+        chunks = json.loads(mock_fs_provider.read_text(manifest_path))["chunks"]
+        assert all(c["file"].endswith(".m4a") for c in chunks)
+
+    @pytest.mark.parametrize("codec_name,copied", [
+        ("aac", True),
+        ("alac", True),
+        ("pcm_s16le", False),
+        ("opus", False),
+        (None, False),  # metadata probed before codec_name was recorded
+    ])
+    def test_plan_and_segment_mp4_copies_only_m4a_codecs(self, mock_subprocess_provider, mock_fs_provider,
+                                                        sample_config, sample_audio_metadata, temp_dir,
+                                                        codec_name, copied):
+        """Test that MP4/MOV audio is stream-copied into .m4a only for AAC/ALAC."""
+        sample_config.reencode.enabled = False
+        sample_audio_metadata["format_name"] = "mov,mp4,m4a,3gp,3g2,mj2"
+        sample_audio_metadata["codec_name"] = codec_name
+        manifest_path = temp_dir / "manifest.json"
+
+        plan_and_segment(
+            Path("/path/to/audio.mov"), sample_audio_metadata, sample_config,
+            temp_dir, manifest_path, mock_subprocess_provider, mock_fs_provider
+        )
+
+        cmd, _ = mock_subprocess_provider.commands_run[0]
+        assert ("copy" in cmd) == copied
+
+        chunks = json.loads(mock_fs_provider.read_text(manifest_path))["chunks"]
+        assert all(c["file"].endswith(".m4a") for c in chunks)
@@ -0,0 +1,107 @@
+"""
+Unit tests for the stitcher module.
+
+Tests merging of chunk transcripts and generation of side outputs.
+"""
+
+import pytest
+import json
+from pathlib import Path
+
+from src.transcribe_pipeline.audio_utils.stitcher import _fmt_ts, enabled_outputs, stitch_outputs, write_side_outputs
+
+
+def _write_manifest(path: Path, texts: list) -> Path:
+    chunks = [
+        {"index": i, "t_start": i * 60.0, "t_end": (i + 1) * 60.0, "text": text}
+        for i, text in enumerate(texts)
+    ]
+    path.write_text(json.dumps({"input": "audio.mp3", "chunks": chunks}), encoding="utf-8")
+    return path
+
+
+class TestFmtTs:
+    """Test subtitle timestamp formatting."""
+
+    @pytest.mark.parametrize("seconds,expected", [
+        (0, "00:00:00,000"),
+        (59.25, "00:00:59,250"),
+        (3725.5, "01:02:05,500"),
+        (36061.007, "10:01:01,007"),
+    ])
+    def test_fmt_ts(self, seconds, expected):
+        """Test HH:MM:SS,mmm formatting."""
+        assert _fmt_ts(seconds) == expected
+
+
+class TestStitchOutputs:
+    """Test merging of chunk transcripts."""
+
+    def test_stitch_outputs_drops_overlap(self, temp_dir):
+        """Test that text repeated across a chunk boundary appears once."""
+        first = " ".join(f"word{i}" for i in range(200))
+        second = " ".join(f"word{i}" for i in range(190, 400))
+        manifest_path = _write_manifest(temp_dir / "manifest.json", [first, second])
+
+        full_text, merged_chunks = stitch_outputs(manifest_path)
+
+        # The second chunk is longer than the dedup window; its tail must survive
+        assert full_text == " ".join(f"word{i}" for i in range(400))
+        assert [c["index"] for c in merged_chunks] == [0, 1]
+
+    def test_stitch_outputs_without_overlap(self, temp_dir):
+        """Test that unrelated chunks are joined with a space."""
+        manifest_path = _write_manifest(temp_dir / "manifest.json", ["First part.", "Second part."])
+
+        full_text, _ = stitch_outputs(manifest_path)
+
+        assert full_text == "First part. Second part."
+
+    def test_stitch_outputs_skips_empty_chunks(self, temp_dir):
+        """Test that chunks without text are left out."""
+        manifest_path = _write_manifest(temp_dir / "manifest.json", ["Hello\r\n", None, "world"])
+
+        full_text, merged_chunks = stitch_outputs(manifest_path)
+
+        assert full_text == "Hello world"
+        assert [c["index"] for c in merged_chunks] == [0, 2]
+
+    def test_stitch_outputs_uses_parsed_manifest(self, temp_dir, sample_config):
+        """Test that a pre-parsed manifest is used instead of re-reading the file."""
+        manifest_path = temp_dir / "missing.json"  # never read
+        manifest = {"chunks": [{"index": 0, "t_start": 0.0, "t_end": 60.0, "text": "Hi"}]}
+
+        full_text, _ = stitch_outputs(manifest_path, manifest=manifest)
+        write_side_outputs(temp_dir, full_text, [], manifest_path, sample_config, manifest=manifest)
+
+        assert full_text == "Hi"
+        assert json.loads((temp_dir / "transcript.json").read_text(encoding="utf-8"))["full_text"] == "Hi"
+
+
+class TestWriteSideOutputs:
+    """Test generation of transcript files."""
+
+    def test_write_side_outputs_enabled_formats(self, temp_dir, sample_config):
+        """Test that exactly the enabled formats are written."""
+        manifest_path = _write_manifest(temp_dir / "manifest.json", ["Hello 世界"])
+        full_text, merged_chunks = stitch_outputs(manifest_path)
+
+        write_side_outputs(temp_dir, full_text, merged_chunks, manifest_path, sample_config)
+
+        assert (temp_dir / "transcript.txt").read_text(encoding="utf-8") == "Hello 世界"
+        assert json.loads((temp_dir / "transcript.json").read_text(encoding="utf-8"))["full_text"] == "Hello 世界"
+        assert "00:00:00,000 --> " in (temp_dir / "transcript.srt").read_text(encoding="utf-8")
+        assert not (temp_dir / "transcript.vtt").exists()  # disabled by default
+    
+    def test_enabled_outputs_matches_written_files(self, temp_dir, sample_config):
+        """Test that the reported file list is exactly what gets written."""
+        sample_config.outputs.write_json = False
+        sample_config.outputs.write_vtt = True
+        manifest_path = _write_manifest(temp_dir / "manifest.json", ["Hello"])
+        full_text, merged_chunks = stitch_outputs(manifest_path)
+        
+        write_side_outputs(temp_dir, full_text, merged_chunks, manifest_path, sample_config)
+        
+        written = sorted(p.name for p in temp_dir.glob("transcript.*"))
+        assert enabled_outputs(sample_config) == ["transcript.txt", "transcript.srt", "transcript.vtt"]
+        assert written == sorted(enabled_outputs(sample_config))
@@ -5,18 +5,32 @@ Tests OpenAI API integration with mocked dependencies.
 """
 
 import pytest
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import Mock
 
 from src.transcribe_pipeline.audio_utils.transcriber import (
+    RETRY_AFTER_MAX_SECS,
+    _is_transient,
     _save_manifest,
+    _request_options,
     _transcribe_one,
     _retrying_transcribe,
     transcribe_manifest,
+    transcribe_manifests,
 )
 
 
+@pytest.fixture
+def keep_sidecar(monkeypatch):
+    """Leave the JSONL sidecar in place after a run so its records can be inspected."""
+    monkeypatch.setattr(
+        "src.transcribe_pipeline.audio_utils.transcriber._clear_results",
+        lambda results_path, fs_provider: None,
+    )
+
+
 class TestSaveManifest:
     """Test manifest saving functionality."""
     
@@ -64,9 +78,9 @@ class TestTranscribeOne:
         mock_time_provider.set_time(1000.0)  # Start time
         
         # Call function
-        text, latency_ms = _transcribe_one(
-            mock_client, chunk, sample_config, mock_openai_provider, mock_time_provider
-        )
+        text, latency_ms = asyncio.run(_transcribe_one(
+            mock_client, chunk, _request_options(sample_config), mock_openai_provider, mock_time_provider
+        ))
         
         # Verify results
         assert text == "Transcribed text content"
@@ -93,13 +107,23 @@ class TestTranscribeOne:
         mock_time_provider.set_time(1000.0)
         
         # Call function
-        text, latency_ms = _transcribe_one(
-            mock_client, chunk, sample_config, mock_openai_provider, mock_time_provider
-        )
+        text, latency_ms = asyncio.run(_transcribe_one(
+            mock_client, chunk, _request_options(sample_config), mock_openai_provider, mock_time_provider
+        ))
         
         assert text == "Technical transcription"
         assert latency_ms >= 0
     
+    def test_request_options_empty_prompt(self, sample_config):
+        """Test that request options are resolved with an empty prompt as None."""
+        sample_config.model.prompt = ""
+        
+        model, response_format, prompt = _request_options(sample_config)
+        
+        assert model == sample_config.model.model
+        assert response_format == sample_config.model.response_format
+        assert prompt is None
+    
     def test_transcribe_one_openai_error(self, mock_openai_provider, mock_time_provider, sample_config):
         """Test error handling when OpenAI API fails."""
         mock_client = Mock()
@@ -115,14 +139,25 @@ class TestTranscribeOne:
         
         # Should raise the exception
         with pytest.raises(Exception, match="API rate limit exceeded"):
-            _transcribe_one(
-                mock_client, chunk, sample_config, mock_openai_provider, mock_time_provider
-            )
+            asyncio.run(_transcribe_one(
+                mock_client, chunk, _request_options(sample_config), mock_openai_provider, mock_time_provider
+            ))
 
 
 class TestRetryingTranscribe:
     """Test retry logic for transcription."""
     
+    @pytest.mark.parametrize("message,expected", [
+        ("Error code: 429 - rate_limit_exceeded", True),
+        ("The server had an error (Server_Error)", True),  # case-insensitive
+        ("temporarily_unavailable, try again", True),
+        ("Error code: 400 - invalid_request_error", False),
+        ("Invalid file format", False),
+    ])
+    def test_is_transient(self, message, expected):
+        """Test classification of retryable API errors."""
+        assert _is_transient(Exception(message)) is expected
+    
     def test_retrying_transcribe_success_first_attempt(self, mock_openai_provider, mock_time_provider, sample_config):
         """Test successful transcription on first attempt."""
         mock_client = Mock()
@@ -137,9 +172,9 @@ class TestRetryingTranscribe:
         mock_time_provider.set_time(1000.0)
         
         # Call function
-        text, latency_ms = _retrying_transcribe(
+        text, latency_ms = asyncio.run(_retrying_transcribe(
             mock_client, chunk, sample_config, mock_openai_provider, mock_time_provider
-        )
+        ))
         
         assert text == "Success on first try"
         assert len(mock_time_provider.sleep_calls) == 0  # No retries needed
@@ -159,13 +194,45 @@ class TestRetryingTranscribe:
         
         # Should raise after max retries (1 in test config)
         with pytest.raises(Exception, match="rate_limit_exceeded"):
-            _retrying_transcribe(
+            asyncio.run(_retrying_transcribe(
                 mock_client, chunk, sample_config, mock_openai_provider, mock_time_provider
-            )
+            ))
         
         # Should have slept once
         assert len(mock_time_provider.sleep_calls) == 1
-        assert mock_time_provider.sleep_calls[0] == 0.1  # 2^0 * 100ms / 1000 (test config has backoff_base_ms=100)
+        assert 0.0 <= mock_time_provider.sleep_calls[0] <= sample_config.model.backoff_schedule[0]  # full jitter
+    
+    def test_retrying_transcribe_honors_retry_after(self, mock_openai_provider, mock_time_provider, sample_config):
+        """Test that a Retry-After header overrides the backoff delay."""
+        mock_client = Mock()
+        chunk = {"file": "/path/to/chunk.m4a"}
+        
+        error = Exception("rate_limit_exceeded")
+        error.response = Mock(headers={"retry-after": "7"})
+        mock_openai_provider.set_transcription_error(Path("/path/to/chunk.m4a"), error)
+        
+        with pytest.raises(Exception, match="rate_limit_exceeded"):
+            asyncio.run(_retrying_transcribe(
+                mock_client, chunk, sample_config, mock_openai_provider, mock_time_provider
+            ))
+        
+        assert mock_time_provider.sleep_calls == [7.0]
+    
+    def test_retrying_transcribe_clamps_retry_after(self, mock_openai_provider, mock_time_provider, sample_config):
+        """Test that an oversized Retry-After header is capped."""
+        mock_client = Mock()
+        chunk = {"file": "/path/to/chunk.m4a"}
+        
+        error = Exception("rate_limit_exceeded")
+        error.response = Mock(headers={"retry-after": "86400"})
+        mock_openai_provider.set_transcription_error(Path("/path/to/chunk.m4a"), error)
+        
+        with pytest.raises(Exception, match="rate_limit_exceeded"):
+            asyncio.run(_retrying_transcribe(
+                mock_client, chunk, sample_config, mock_openai_provider, mock_time_provider
+            ))
+        
+        assert mock_time_provider.sleep_calls == [RETRY_AFTER_MAX_SECS]
     
     def test_retrying_transcribe_non_transient_error(self, mock_openai_provider, mock_time_provider, sample_config):
         """Test that non-transient errors are not retried."""
@@ -182,9 +249,9 @@ class TestRetryingTranscribe:
         
         # Should raise immediately without retry
         with pytest.raises(Exception, match="Invalid audio format"):
-            _retrying_transcribe(
+            asyncio.run(_retrying_transcribe(
                 mock_client, chunk, sample_config, mock_openai_provider, mock_time_provider
-            )
+            ))
         
         # Should not have slept
         assert len(mock_time_provider.sleep_calls) == 0
@@ -227,6 +294,187 @@ class TestTranscribeManifest:
             assert chunk["latency_ms"] is not None
             assert chunk["latency_ms"] >= 0
     
+    def test_transcribe_manifest_appends_results(self, mock_openai_provider, mock_fs_provider, 
+                                               mock_time_provider, mock_env_provider, sample_config, 
+                                               sample_manifest, temp_dir, keep_sidecar):
+        """Test that each completed chunk is logged to the JSONL sidecar."""
+        manifest_path = temp_dir / "manifest.json"
+        mock_fs_provider.set_file_content(manifest_path, json.dumps(sample_manifest))
+        
+        transcribe_manifest(
+            manifest_path, sample_config,
+            mock_openai_provider, mock_fs_provider, mock_time_provider, mock_env_provider
+        )
+        
+        lines = mock_fs_provider.read_text(temp_dir / "manifest.jsonl").splitlines()
+        records = [json.loads(line) for line in lines]
+        
+        assert sorted(r["index"] for r in records) == [0, 1]
+        assert all(r["status"] == "done" for r in records)
+    
+    def test_transcribe_manifest_clears_results(self, mock_openai_provider, mock_fs_provider, 
+                                              mock_time_provider, mock_env_provider, sample_config, 
+                                              sample_manifest, temp_dir):
+        """Test that the sidecar is emptied once the final manifest is saved."""
+        manifest_path = temp_dir / "manifest.json"
+        mock_fs_provider.set_file_content(manifest_path, json.dumps(sample_manifest))
+        
+        transcribe_manifest(
+            manifest_path, sample_config,
+            mock_openai_provider, mock_fs_provider, mock_time_provider, mock_env_provider
+        )
+        
+        assert mock_fs_provider.read_binary(temp_dir / "manifest.jsonl") == b""
+        chunks = json.loads(mock_fs_provider.read_text(manifest_path))["chunks"]
+        assert [c["status"] for c in chunks] == ["done", "done"]
+    
+    def test_transcribe_manifest_resumes_from_results(self, mock_openai_provider, mock_fs_provider, 
+                                                    mock_time_provider, mock_env_provider, sample_config, 
+                                                    sample_manifest, temp_dir, keep_sidecar):
+        """Test that results logged after the last manifest save are not re-requested."""
+        manifest_path = temp_dir / "manifest.json"
+        mock_fs_provider.set_file_content(manifest_path, json.dumps(sample_manifest))
+        mock_fs_provider.set_binary_content(
+            temp_dir / "manifest.jsonl",
+            b'{"index":0,"status":"done","text":"Recovered","latency_ms":12,"error":null}\n'
+            b'{"index":1,"status":"do',  # torn write from the interrupted run
+        )
+        
+        transcribe_manifest(
+            manifest_path, sample_config,
+            mock_openai_provider, mock_fs_provider, mock_time_provider, mock_env_provider
+        )
+        
+        chunks = json.loads(mock_fs_provider.read_text(manifest_path))["chunks"]
+        assert [f for _, f in mock_openai_provider.transcription_calls] == [chunks[1]["file"]]
+        assert chunks[0]["text"] == "Recovered"
+        assert chunks[0]["latency_ms"] == 12
+        assert [c["status"] for c in chunks] == ["done", "done"]
+        last = mock_fs_provider.read_text(temp_dir / "manifest.jsonl").splitlines()[-1]
+        assert json.loads(last)["index"] == 1  # new record not glued to the torn line
+    
+    def test_transcribe_manifest_shares_one_client(self, mock_openai_provider, mock_fs_provider, 
+                                                 mock_time_provider, mock_env_provider, sample_config, 
+                                                 sample_manifest, temp_dir):
+        """Test that all chunks, including retries, go through a single client."""
+        manifest_path = temp_dir / "manifest.json"
+        mock_fs_provider.set_file_content(manifest_path, json.dumps(sample_manifest))
+        mock_openai_provider.set_transcription_error(
+            Path(sample_manifest["chunks"][0]["file"]), Exception("rate_limit_exceeded")
+        )
+        
+        transcribe_manifest(
+            manifest_path, sample_config,
+            mock_openai_provider, mock_fs_provider, mock_time_provider, mock_env_provider
+        )
+        
+        assert len(mock_openai_provider.clients_created) == 1
+        client = mock_openai_provider.clients_created[0][1]
+        calls = mock_openai_provider.transcription_calls
+        assert len(calls) == 3  # two chunks plus one retry
+        assert all(c is client for c, _ in calls)
+        assert mock_openai_provider.clients_closed == [client]
+    
+    def test_transcribe_manifest_shares_http_pool(self, mock_openai_provider, mock_fs_provider, 
+                                                mock_time_provider, mock_env_provider, sample_config, 
+                                                sample_manifest, temp_dir):
+        """Test that the shared client's connection pool is sized for the request fan-out."""
+        sample_config.model.parallel_requests = 4
+        manifest_path = temp_dir / "manifest.json"
+        mock_fs_provider.set_file_content(manifest_path, json.dumps(sample_manifest))
+        
+        transcribe_manifest(
+            manifest_path, sample_config,
+            mock_openai_provider, mock_fs_provider, mock_time_provider, mock_env_provider
+        )
+        
+        (api_key, client), = mock_openai_provider.clients_created
+        assert api_key == "test-api-key"
+        assert client.max_connections == 4
+    
+    def test_transcribe_manifest_more_chunks_than_workers(self, mock_openai_provider, mock_fs_provider, 
+                                                        mock_time_provider, mock_env_provider, sample_config, 
+                                                        temp_dir):
+        """Test that the bounded task window refills until every chunk is done."""
+        manifest_path = temp_dir / "manifest.json"
+        chunks = [{"index": i, "file": f"/tmp/chunk_{i:04d}.m4a", "status": "pending"} for i in range(7)]
+        mock_fs_provider.set_file_content(manifest_path, json.dumps({"chunks": chunks}))
+        sample_config.model.parallel_requests = 2
+        
+        transcribe_manifest(
+            manifest_path, sample_config,
+            mock_openai_provider, mock_fs_provider, mock_time_provider, mock_env_provider
+        )
+        
+        updated = json.loads(mock_fs_provider.read_text(manifest_path))
+        assert all(c["status"] == "done" for c in updated["chunks"])
+        assert len(mock_openai_provider.transcription_calls) == 7
+    
+    def test_transcribe_manifest_keeps_manifest_order(self, mock_openai_provider, mock_fs_provider, 
+                                                    mock_time_provider, mock_env_provider, sample_config, 
+                                                    sample_manifest, temp_dir, keep_sidecar):
+        """Test that results land on their own chunk when completions arrive out of order."""
+        manifest_path = temp_dir / "manifest.json"
+        mock_fs_provider.set_file_content(manifest_path, json.dumps(sample_manifest))
+        sample_config.model.parallel_requests = 2
+        for chunk in sample_manifest["chunks"]:
+            mock_openai_provider.set_transcription_result(
+                Path(chunk["file"]), {"text": f"Transcribed chunk {chunk['index']}"}
+            )
+        mock_openai_provider.set_transcription_delay(Path(sample_manifest["chunks"][0]["file"]), 0.05)
+        
+        transcribe_manifest(
+            manifest_path, sample_config,
+            mock_openai_provider, mock_fs_provider, mock_time_provider, mock_env_provider
+        )
+        
+        lines = mock_fs_provider.read_text(temp_dir / "manifest.jsonl").splitlines()
+        assert [json.loads(line)["index"] for line in lines] == [1, 0]  # completion order
+        
+        updated = json.loads(mock_fs_provider.read_text(manifest_path))
+        assert [c["index"] for c in updated["chunks"]] == [0, 1]
+        assert [c["text"] for c in updated["chunks"]] == ["Transcribed chunk 0", "Transcribed chunk 1"]
+    
+    def test_transcribe_manifests_share_one_client(self, mock_openai_provider, mock_fs_provider, 
+                                                 mock_time_provider, mock_env_provider, sample_config, 
+                                                 temp_dir, keep_sidecar):
+        """Test that a batch of manifests is transcribed over a single client."""
+        paths = []
+        for name in ("first", "second"):
+            manifest_path = temp_dir / name / "manifest.json"
+            chunks = [{"index": i, "file": f"/tmp/{name}_{i}.m4a", "status": "pending"} for i in range(2)]
+            mock_fs_provider.set_file_content(manifest_path, json.dumps({"chunks": chunks}))
+            mock_openai_provider.set_transcription_result(Path(f"/tmp/{name}_1.m4a"), {"text": name})
+            paths.append(manifest_path)
+        
+        transcribe_manifests(
+            paths, sample_config,
+            mock_openai_provider, mock_fs_provider, mock_time_provider, mock_env_provider
+        )
+        
+        assert len(mock_openai_provider.clients_created) == 1
+        assert len(mock_openai_provider.clients_closed) == 1
+        for name, manifest_path in zip(("first", "second"), paths):
+            chunks = json.loads(mock_fs_provider.read_text(manifest_path))["chunks"]
+            assert [c["status"] for c in chunks] == ["done", "done"]
+            assert chunks[1]["text"] == name  # results stay with their own manifest
+            assert len(mock_fs_provider.read_text(manifest_path.with_suffix(".jsonl")).splitlines()) == 2
+    
+    def test_transcribe_manifest_corrupt_manifest_creates_no_client(self, mock_openai_provider, mock_fs_provider, 
+                                                                  mock_time_provider, mock_env_provider, sample_config, 
+                                                                  temp_dir):
+        """Test that an unreadable manifest fails before any connection pool is opened."""
+        manifest_path = temp_dir / "manifest.json"
+        mock_fs_provider.set_file_content(manifest_path, "{not json")
+        
+        with pytest.raises(ValueError):
+            transcribe_manifest(
+                manifest_path, sample_config,
+                mock_openai_provider, mock_fs_provider, mock_time_provider, mock_env_provider
+            )
+        
+        assert mock_openai_provider.clients_created == []
+    
     def test_transcribe_manifest_missing_api_key(self, mock_openai_provider, mock_fs_provider, 
                                                mock_time_provider, sample_config, sample_manifest, temp_dir):
         """Test error when OpenAI API key is missing."""
@@ -310,6 +558,7 @@ class TestTranscribeManifest:
         # Should complete without calling OpenAI transcription
         # Note: A client is still created for the function, but no transcription calls are made
         assert len(mock_openai_provider.clients_created) == 1  # Client created but no transcriptions
+        assert len(mock_openai_provider.clients_closed) == 1  # Connection pool released on exit
     
     def test_transcribe_manifest_backward_compatibility(self, sample_config, sample_manifest, temp_dir):
         """Test backward compatibility with default providers."""